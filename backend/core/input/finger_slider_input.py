@@ -36,6 +36,9 @@ class FingerSliderInput(InputController):
         max_touch_scale: float = 2.0,
         min_hand_separation: float = 0.12,
         gesture_update_interval: float = 0.1,
+        model_complexity: int = 0,
+        hand_landmarker_model: Optional[Union[str, Path]] = None,
+        motion_threshold: float = 0.0,
     ) -> None:
         self._strategy = FingerSliderStrategy(
             camera_index=camera_index,
@@ -61,6 +64,9 @@ class FingerSliderInput(InputController):
             max_touch_scale=max_touch_scale,
             min_hand_separation=min_hand_separation,
             gesture_update_interval=gesture_update_interval,
+            model_complexity=model_complexity,
+            hand_landmarker_model=hand_landmarker_model,
+            motion_threshold=motion_threshold,
         )
 
     @property
@@ -1,6 +1,16 @@
 from .camera_base import CameraBase
 from .local_camera import LocalCamera
 from .ip_camera import IPCamera
+from .threaded_camera import LatestSlot, ThreadedCamera, pin_current_thread, put_latest
 from .camera_selector import select_camera_index
 
-__all__ = ["CameraBase", "LocalCamera", "IPCamera", "select_camera_index"]
+__all__ = [
+    "CameraBase",
+    "LocalCamera",
+    "IPCamera",
+    "ThreadedCamera",
+    "LatestSlot",
+    "put_latest",
+    "pin_current_thread",
+    "select_camera_index",
+]
@@ -0,0 +1,44 @@
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+class FramePool:
+    """Small ring of reusable frame buffers for ``VideoCapture.retrieve``.
+
+    Each call to :meth:`acquire` hands out the next buffer in the ring, so a
+    frame returned by a camera stays valid until ``size - 1`` further frames
+    have been read. Consumers that need to hold on to a frame longer than that
+    must copy it.
+    """
+
+    def __init__(self, size: int = 3):
+        self._buffers: List[Optional[np.ndarray]] = [None] * max(1, size)
+        self._index = 0
+
+    def acquire(self) -> Optional[np.ndarray]:
+        """Return the next buffer to decode into (``None`` until first use)."""
+        self._index = (self._index + 1) % len(self._buffers)
+        return self._buffers[self._index]
+
+    def store(self, frame: Any) -> None:
+        """Adopt the frame OpenCV returned for the current slot.
+
+        OpenCV writes into the buffer passed to ``retrieve`` when its shape and
+        dtype match and allocates a new array otherwise (first frame or a
+        resolution change), so keeping whatever came back lets later reads
+        reuse it.
+        """
+        if isinstance(frame, np.ndarray):
+            self._buffers[self._index] = frame
+
+
+def read_pooled(capture: Any, pool: FramePool):
+    """Grab and decode the next frame of ``capture`` into a pooled buffer."""
+    if not capture.grab():
+        return False, None
+    ok, frame = capture.retrieve(pool.acquire())
+    if not ok:
+        return False, None
+    pool.store(frame)
+    return True, frame
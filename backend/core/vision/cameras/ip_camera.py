@@ -1,5 +1,6 @@
 import cv2
 from .camera_base import CameraBase
+from .frame_pool import FramePool, read_pooled
 
 
 class IPCamera(CameraBase):
@@ -10,10 +11,15 @@ class IPCamera(CameraBase):
         self._capture = cv2.VideoCapture(url)
         if not self._capture or not self._capture.isOpened():
             raise RuntimeError(f"Failed to open IP camera at {url}.")
+        self._frame_pool = FramePool()
 
     def read(self):
-        """Read a frame from the camera."""
-        return self._capture.read()
+        """Read a frame from the camera.
+
+        Frames are decoded into a small ring of reused buffers, so the returned
+        array is only valid until a couple more frames have been read.
+        """
+        return read_pooled(self._capture, self._frame_pool)
 
     def release(self):
         """Release the camera capture."""
@@ -1,6 +1,7 @@
 import cv2
 from typing import Optional
 from .camera_base import CameraBase
+from .frame_pool import FramePool, read_pooled
 from .camera_selector import select_camera_index
 
 
@@ -13,10 +14,29 @@ class LocalCamera(CameraBase):
         self._capture = cv2.VideoCapture(selected_index, cv2.CAP_DSHOW)
         if not self._capture or not self._capture.isOpened():
             raise RuntimeError(f"Failed to open camera index {selected_index}.")
+        # Keep the driver queue to a single frame so a grab never returns a stale image.
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._frame_pool = FramePool()
 
     def read(self):
-        """Read a frame from the camera."""
-        return self._capture.read()
+        """Read a frame from the camera.
+
+        Frames are decoded into a small ring of reused buffers, so the returned
+        array is only valid until a couple more frames have been read.
+        """
+        return read_pooled(self._capture, self._frame_pool)
+
+    def grab(self) -> bool:
+        """Advance to the next frame without decoding it."""
+        return self._capture.grab()
+
+    def retrieve(self):
+        """Decode the most recently grabbed frame into a pooled buffer."""
+        ok, frame = self._capture.retrieve(self._frame_pool.acquire())
+        if not ok:
+            return False, None
+        self._frame_pool.store(frame)
+        return True, frame
 
     def release(self):
         """Release the camera capture."""
@@ -0,0 +1,140 @@
+import os
+import queue
+import threading
+import time
+from typing import Any, Generic, Optional, Tuple, TypeVar
+
+from .camera_base import CameraBase
+
+T = TypeVar("T")
+
+
+def put_latest(target: "queue.Queue[Any]", item: Any) -> None:
+    """Put ``item`` on a bounded queue, evicting stale entries when it is full."""
+    while True:
+        try:
+            target.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                target.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def pin_current_thread(core: int) -> bool:
+    """Restrict the calling thread to a single CPU core where the OS allows it.
+
+    Uses ``os.sched_setaffinity`` (Linux), which applies to the calling thread
+    only. Other platforms only expose process-wide affinity, so this is a no-op
+    there and returns ``False``.
+    """
+    set_affinity = getattr(os, "sched_setaffinity", None)
+    if set_affinity is None:
+        return False
+    try:
+        set_affinity(0, {core})
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+class LatestSlot(Generic[T]):
+    """Lock-guarded single-value slot where every write replaces the previous one."""
+
+    def __init__(self, initial: Optional[T] = None):
+        self._lock = threading.Lock()
+        self._value = initial
+        self._version = 0
+
+    def set(self, value: T) -> None:
+        with self._lock:
+            self._value = value
+            self._version += 1
+
+    def get(self) -> Tuple[int, Optional[T]]:
+        """Return ``(version, value)`` so readers can tell whether it changed."""
+        with self._lock:
+            return self._version, self._value
+
+
+class ThreadedCamera(CameraBase):
+    """Reads a wrapped camera on a background thread, keeping only the newest frame.
+
+    The capture queue holds a single frame; when the consumer falls behind the
+    older frame is dropped so ``read`` always returns the most recent image
+    instead of a backlog of stale ones.
+
+    Cameras that expose ``grab``/``retrieve`` (such as :class:`LocalCamera`) are
+    grabbed continuously but only decoded once ``read`` asks for a frame, so
+    frames nobody consumes never pay for decoding.
+    """
+
+    def __init__(
+        self,
+        camera: CameraBase,
+        read_timeout: float = 1.0,
+        cpu_core: Optional[int] = None,
+    ):
+        self._camera = camera
+        self._read_timeout = read_timeout
+        self._cpu_core = cpu_core
+        self._frames: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._frame_wanted = threading.Event()
+        self._on_demand = callable(getattr(camera, "grab", None)) and callable(
+            getattr(camera, "retrieve", None)
+        )
+        self._thread = threading.Thread(
+            target=self._capture_loop, name="camera-capture", daemon=True
+        )
+        self._thread.start()
+
+    def _capture_loop(self) -> None:
+        if self._cpu_core is not None:
+            pin_current_thread(self._cpu_core)
+        while not self._stop_event.is_set():
+            if self._on_demand:
+                ok, frame = self._grab_or_retrieve()
+            else:
+                ok, frame = self._camera.read()
+            if not ok:
+                time.sleep(0.01)
+                continue
+            if frame is not None:
+                put_latest(self._frames, frame)
+
+    def _grab_or_retrieve(self) -> Tuple[bool, Any]:
+        """Grab the next frame, decoding it only when a reader is waiting."""
+        camera: Any = self._camera
+        if not camera.grab():
+            return False, None
+        if not self._frame_wanted.is_set():
+            return True, None
+        self._frame_wanted.clear()
+        return camera.retrieve()
+
+    def read(self):
+        """Return the newest captured frame, waiting up to ``read_timeout`` for one."""
+        if self._on_demand:
+            self._frame_wanted.set()
+        try:
+            return True, self._frames.get(timeout=self._read_timeout)
+        except queue.Empty:
+            return False, None
+
+    def release(self):
+        """Stop the capture thread and release the wrapped camera."""
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._camera.release()
+
+    def is_opened(self):
+        """Check if the wrapped camera is opened."""
+        return self._camera.is_opened()
+
+    @property
+    def camera(self) -> CameraBase:
+        """Get the wrapped camera."""
+        return self._camera
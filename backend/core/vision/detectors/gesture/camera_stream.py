@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+import cv2
+
+CAPTURE_BACKENDS = {
+    "msmf": cv2.CAP_MSMF,
+    "dshow": cv2.CAP_DSHOW,
+}
+
+
+def open_capture(
+    index: int,
+    backend: str = "msmf",
+    width: int = 640,
+    height: int = 480,
+) -> Any:
+    """Open ``index`` with the preferred backend, falling back to the others.
+
+    The camera is asked for MJPEG at ``width`` x ``height``; drivers that do not
+    support it keep their default format, so the request is best effort.
+    """
+    order = [backend] + [name for name in CAPTURE_BACKENDS if name != backend]
+    for name in order:
+        capture = cv2.VideoCapture(index, CAPTURE_BACKENDS[name])
+        if capture is not None and capture.isOpened():
+            break
+        if capture is not None:
+            capture.release()
+    else:
+        raise RuntimeError(f"Unable to open camera index {index}")
+    capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    return capture
+
+
+class CameraStream:
+    """Reads a ``cv2.VideoCapture`` on a background thread.
+
+    The thread keeps only the most recent decoded frame, so consumers never
+    block on camera I/O for longer than it takes the next frame to arrive and
+    never see a backlog of stale frames when they run slower than the camera.
+    Each frame is handed out once; the caller owns the returned array.
+    """
+
+    def __init__(self, capture: Any):
+        self._capture = capture
+        self._condition = threading.Condition()
+        self._frame: Optional[Any] = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="camera-stream", daemon=True)
+
+    def start(self) -> "CameraStream":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if not self._capture.grab():
+                time.sleep(0.01)
+                continue
+            success, frame = self._capture.retrieve()
+            if not success:
+                continue
+            with self._condition:
+                self._frame = frame
+                self._condition.notify_all()
+
+    def read(self, timeout: float = 1.0) -> Tuple[bool, Optional[Any]]:
+        """Return the newest frame not yet handed out, waiting up to ``timeout``."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._frame is not None, timeout):
+                return False, None
+            frame, self._frame = self._frame, None
+        return True, frame
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
@@ -5,9 +5,10 @@ import csv
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 import cv2
+import numpy as np
 
 import mediapipe as mp
 
@@ -16,9 +17,18 @@ PROJECT_ROOT = Path(__file__).resolve().parents[0]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from gesture_recognizer import GestureFeatureExtractor  # noqa: E402
+from camera_stream import CAPTURE_BACKENDS, CameraStream, open_capture  # noqa: E402
+from gesture_recognizer import (  # noqa: E402
+    GestureFeatureExtractor,
+    landmarks_to_array,
+    raw_landmark_columns,
+)
+from overlay_strip import OverlayStrip, TextLine  # noqa: E402
 
 
+IDLE_PREVIEW_STRIDE = 2
+OVERLAY_CONTROLS_LINE = "Press 'n' to skip gesture, 'q' to quit"
+
 GESTURE_HINTS = {
     "neutral": "Relax your hand and keep fingers apart",
     "rock_and_roll": "Extend index+pink and tuck middle/ring",
@@ -58,6 +68,17 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Camera index to use (default: 0).",
     )
+    parser.add_argument(
+        "--camera-backend",
+        choices=sorted(CAPTURE_BACKENDS),
+        default="msmf",
+        help=(
+            "OpenCV capture backend to try first; the other is used if it fails to open. "
+            "'msmf' (Media Foundation) has lower latency and negotiates MJPEG, which is "
+            "cheaper to decode than the uncompressed YUY2 'dshow' (DirectShow) tends to "
+            "pick, but a few older webcams only work with 'dshow'. (default: msmf)"
+        ),
+    )
     parser.add_argument(
         "--min-confidence",
         type=float,
@@ -76,32 +97,128 @@ def parse_args() -> argparse.Namespace:
         default=2,
         help="Maximum number of hands to track simultaneously.",
     )
+    parser.add_argument(
+        "--inference-width",
+        type=int,
+        default=640,
+        help=(
+            "Downscale frames wider than this (keeping aspect ratio) before running MediaPipe. "
+            "Landmarks are normalized, so samples are unaffected. Use 0 to disable."
+        ),
+    )
+    parser.add_argument(
+        "--min-pose-delta",
+        type=float,
+        default=0.01,
+        help=(
+            "Grid size (in normalized image units) used to quantize landmark x/y before comparing "
+            "against the previous sample of the same hand; unchanged poses are not recorded again. "
+            "Use 0 to record every frame."
+        ),
+    )
+    parser.add_argument(
+        "--raw-landmarks",
+        action="store_true",
+        help=(
+            "Record raw x/y/z landmark coordinates instead of normalized features. "
+            "train_gesture_model.py normalizes them in one batch when loading the dataset, "
+            "keeping the capture loop as light as possible."
+        ),
+    )
     return parser.parse_args()
 
 
-def write_samples(
-    output_path: Path,
-    samples: List[Dict[str, float]],
-    feature_count: int,
-    append: bool,
-) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["gesture", "handedness"] + [f"f{i}" for i in range(feature_count)]
-    write_header = not append or not output_path.exists()
-    mode = "a" if append and output_path.exists() else "w"
-    with output_path.open(mode, newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+class SampleSink:
+    """Streams samples to the dataset CSV as they are captured.
+
+    The file is opened on the first sample (once the feature count is known),
+    so an empty session never touches the dataset. Each gesture's starting
+    offset is remembered so its rows can be truncated away again.
+    """
+
+    def __init__(self, output_path: Path, append: bool, raw_landmarks: bool = False):
+        self._output_path = output_path
+        self._append = append
+        self._raw_landmarks = raw_landmarks
+        self._fh: Optional[TextIO] = None
+        self._writer: Any = None
+        self._gesture_offset = 0
+        self._gesture_count = 0
+        self.count = 0
+
+    def __enter__(self) -> "SampleSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _open(self, value_count: int) -> None:
+        if self._raw_landmarks:
+            columns = raw_landmark_columns(value_count // 3)
+        else:
+            columns = [f"f{i}" for i in range(value_count)]
+        header = ["gesture", "handedness"] + columns
+
+        self._output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not self._append or not self._output_path.exists()
+        if not write_header:
+            with self._output_path.open("r", newline="", encoding="utf-8") as existing:
+                existing_header = next(csv.reader(existing), None)
+            if existing_header is not None and existing_header != header:
+                raise ValueError(
+                    f"Cannot append to {self._output_path}: its columns do not match this "
+                    "capture mode (raw landmarks vs. features)."
+                )
+            write_header = existing_header is None
+        mode = "w" if write_header else "a"
+        self._fh = self._output_path.open(mode, newline="", encoding="utf-8")
+        self._writer = csv.writer(self._fh)
         if write_header:
-            writer.writeheader()
-        for row in samples:
-            writer.writerow(row)
+            self._writer.writerow(header)
+        self._fh.flush()
+        self._gesture_offset = self._fh.tell()
+
+    def start_gesture(self) -> None:
+        self._gesture_count = 0
+        if self._fh is not None:
+            self._fh.flush()
+            self._gesture_offset = self._fh.tell()
+
+    def append(self, sample: Tuple[object, ...]) -> None:
+        if self._fh is None:
+            self._open(len(sample) - 2)
+        self._writer.writerow(sample)
+        self._gesture_count += 1
+        self.count += 1
+
+    def discard_gesture(self) -> None:
+        """Drop every sample written since the last ``start_gesture``."""
+        self.count -= self._gesture_count
+        self._gesture_count = 0
+        if self._fh is None:
+            return
+        self._fh.flush()
+        self._fh.seek(self._gesture_offset)
+        self._fh.truncate()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def pose_key(points: np.ndarray, grid: float) -> bytes:
+    """Coarse fingerprint of a pose: landmark x/y snapped to a ``grid``-sized lattice."""
+    return np.floor(points[:, :2] / grid).astype(np.int32).tobytes()
 
 
 def main() -> None:
     args = parse_args()
-    capture = cv2.VideoCapture(args.camera, cv2.CAP_DSHOW)
-    if not capture or not capture.isOpened():
-        raise RuntimeError(f"Unable to open camera index {args.camera}")
+    capture = open_capture(args.camera, args.camera_backend)
+    # Keep the driver queue to a single frame so recorded samples match the
+    # pose the user is holding now rather than a few frames ago.
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    stream = CameraStream(capture).start()
 
     feature_extractor = GestureFeatureExtractor()
     hands = mp.solutions.hands.Hands(
@@ -110,104 +227,133 @@ def main() -> None:
         min_tracking_confidence=0.6,
     )
 
-    samples: List[Dict[str, float]] = []
-    feature_count: Optional[int] = None
+    landmark_buffer = np.empty((max(1, args.max_hands), 21, 3), dtype=np.float32)
+    overlay = OverlayStrip()
+    rgb_buffer: Optional[np.ndarray] = None
     window_name = "Gesture Dataset Collector"
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
 
     try:
-        for gesture in args.gestures:
-            collected = 0
-            recording = False
-            while collected < args.samples:
-                success, frame = capture.read()
-                if not success:
-                    print("Warning: failed to read frame from camera")
-                    time.sleep(0.05)
-                    continue
-
-                frame = cv2.flip(frame, 1)
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb)
-
-                hint = GESTURE_HINTS.get(gesture, "Hold pose steady for clean samples")
-                overlay_lines = [
-                    f"Gesture: {gesture} ({collected}/{args.samples})",
-                    f"Recording: {'ON' if recording else 'OFF'} [space to toggle]",
-                    f"Hint: {hint}",
-                    "Press 'n' to skip gesture, 'q' to quit",
-                ]
-
-                if recording and results.multi_hand_landmarks and results.multi_handedness:
-                    for landmark_list, handedness in zip(
-                        results.multi_hand_landmarks, results.multi_handedness
-                    ):
-                        score = handedness.classification[0].score
-                        if score < args.min_confidence:
-                            continue
-                        hand_label = handedness.classification[0].label
-                        features = feature_extractor.extract(
-                            list(landmark_list.landmark), hand_label
+        with SampleSink(args.output, args.append, args.raw_landmarks) as sink:
+            for gesture in args.gestures:
+                sink.start_gesture()
+                last_pose_keys: Dict[str, bytes] = {}
+                hint_line = f"Hint: {GESTURE_HINTS.get(gesture, 'Hold pose steady for clean samples')}"
+                overlay_state: Optional[Tuple[int, bool]] = None
+                overlay_lines: Tuple[TextLine, ...] = ()
+                collected = 0
+                recording = False
+                tick = 0
+                while collected < args.samples:
+                    success, frame = stream.read()
+                    if not success:
+                        print("Warning: failed to read frame from camera")
+                        time.sleep(0.05)
+                        continue
+                    tick += 1
+                    # While idle only every Nth frame is processed for the preview.
+                    if not recording and tick % IDLE_PREVIEW_STRIDE:
+                        continue
+
+                    frame = cv2.flip(frame, 1)
+                    # MediaPipe only needs a small frame; the overlay uses the full one.
+                    inference_frame = frame
+                    frame_h, frame_w = frame.shape[:2]
+                    if 0 < args.inference_width < frame_w:
+                        inference_size = (
+                            args.inference_width,
+                            max(1, round(frame_h * args.inference_width / frame_w)),
+                        )
+                        inference_frame = cv2.resize(
+                            frame, inference_size, interpolation=cv2.INTER_AREA
+                        )
+                    # Convert into a reused buffer; it is only reallocated if the frame size changes.
+                    if rgb_buffer is None or rgb_buffer.shape != inference_frame.shape:
+                        rgb_buffer = np.empty_like(inference_frame)
+                    cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+                    results = hands.process(rgb_buffer)
+
+                    if recording and results.multi_hand_landmarks and results.multi_handedness:
+                        # Gather every accepted hand first so features are computed in one batch.
+                        batch_limit = min(len(landmark_buffer), args.samples - collected)
+                        batch_labels: List[str] = []
+                        for landmark_list, handedness in zip(
+                            results.multi_hand_landmarks, results.multi_handedness
+                        ):
+                            if len(batch_labels) >= batch_limit:
+                                break
+                            score = handedness.classification[0].score
+                            if score < args.min_confidence:
+                                continue
+                            hand_label = handedness.classification[0].label
+                            points = landmarks_to_array(
+                                landmark_list, out=landmark_buffer[len(batch_labels)]
+                            )
+                            if points is None:
+                                continue
+                            if args.min_pose_delta > 0:
+                                pose = pose_key(points, args.min_pose_delta)
+                                if last_pose_keys.get(hand_label) == pose:
+                                    continue
+                                last_pose_keys[hand_label] = pose
+                            batch_labels.append(hand_label)
+
+                        if batch_labels:
+                            batch = landmark_buffer[: len(batch_labels)]
+                            if args.raw_landmarks:
+                                rows = batch.reshape(len(batch_labels), -1).tolist()
+                            else:
+                                rows = feature_extractor.extract_batch(batch, batch_labels).tolist()
+                            for hand_label, values in zip(batch_labels, rows):
+                                sink.append((gesture, hand_label, *values))
+                            collected += len(batch_labels)
+                            if collected >= args.samples:
+                                recording = False
+
+                    if overlay_state != (collected, recording):
+                        overlay_state = (collected, recording)
+                        color = (0, 255, 0) if recording else (200, 200, 200)
+                        overlay_lines = tuple(
+                            (text, 0.6, color)
+                            for text in (
+                                f"Gesture: {gesture} ({collected}/{args.samples})",
+                                f"Recording: {'ON' if recording else 'OFF'} [space to toggle]",
+                                hint_line,
+                                OVERLAY_CONTROLS_LINE,
+                            )
                         )
-                        if features is None:
-                            continue
-                        if feature_count is None:
-                            feature_count = len(features)
-                        sample = {
-                            "gesture": gesture,
-                            "handedness": hand_label,
-                        }
-                        sample.update({f"f{i}": float(value) for i, value in enumerate(features)})
-                        samples.append(sample)
-                        collected += 1
-                        if collected >= args.samples:
-                            recording = False
-                            break
-
-                for idx, text in enumerate(overlay_lines):
-                    cv2.putText(
-                        frame,
-                        text,
-                        (10, 20 + idx * 20),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        (0, 255, 0) if recording else (200, 200, 200),
-                        1,
-                        cv2.LINE_AA,
-                    )
-
-                cv2.imshow(window_name, frame)
-                key = cv2.waitKey(1) & 0xFF
-                if key in (ord("q"), 27):
-                    raise KeyboardInterrupt
-                if key == ord("n"):
-                    print(f"Skipping gesture '{gesture}' after collecting {collected} samples")
-                    break
-                if key == ord(" "):
-                    recording = not recording
-                if key == ord("c"):
-                    recording = False
-                    samples = [s for s in samples if s["gesture"] != gesture]
-                    collected = 0
-
-            print(f"Captured {collected} samples for '{gesture}'")
+                    overlay.draw(frame, overlay_lines)
+
+                    cv2.imshow(window_name, frame)
+                    key = cv2.waitKey(1) & 0xFF
+                    if key in (ord("q"), 27):
+                        raise KeyboardInterrupt
+                    if key == ord("n"):
+                        print(f"Skipping gesture '{gesture}' after collecting {collected} samples")
+                        break
+                    if key == ord(" "):
+                        recording = not recording
+                    if key == ord("c"):
+                        recording = False
+                        sink.discard_gesture()
+                        last_pose_keys.clear()
+                        collected = 0
+
+                print(f"Captured {collected} samples for '{gesture}'")
 
     except KeyboardInterrupt:
         print("\nCapture interrupted by user")
     finally:
         hands.close()
+        stream.stop()
         capture.release()
         cv2.destroyWindow(window_name)
 
-    if not samples:
+    if not sink.count:
         print("No samples collected; nothing to save.")
         return
 
-    if feature_count is None:
-        raise RuntimeError("No valid samples captured; feature extraction failed.")
-
-    write_samples(args.output, samples, feature_count, args.append)
-    print(f"Saved {len(samples)} samples to {args.output}")
+    print(f"Saved {sink.count} samples to {args.output}")
 
 
 if __name__ == "__main__":
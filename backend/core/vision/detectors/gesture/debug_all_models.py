@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from gesture_recognizer import MODEL_BACKENDS  # noqa: E402
+
 DEBUG_SCRIPT = SCRIPT_DIR / "debug_gesture_recognition.py"
 DEFAULT_CONFIG = SCRIPT_DIR / "gestures.yml"
 DEFAULT_MODELS_DIR = SCRIPT_DIR / "models"
@@ -55,6 +61,13 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional max_hands override.",
     )
+    parser.add_argument(
+        "--complexity",
+        type=int,
+        choices=(0, 1),
+        default=None,
+        help="Optional MediaPipe landmark model complexity override.",
+    )
     parser.add_argument(
         "--min-detect",
         type=float,
@@ -91,16 +104,30 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional max history override.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=MODEL_BACKENDS,
+        default=None,
+        help="Optional model inference backend override.",
+    )
     parser.add_argument(
         "--save-log",
         type=Path,
         default=None,
         help="If provided, forward --save-log to capture recognizer events.",
     )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help=(
+            "Run the debug script in a separate Python process instead of in-process, "
+            "so a crash in MediaPipe or a model cannot take this launcher down with it."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
-        help="Echo the command before launching the debug script.",
+        help="Echo the debug arguments before launching the debug script.",
     )
     return parser.parse_args()
 
@@ -113,64 +140,101 @@ def resolve_path(path: Path) -> Path:
 
 def collect_models(args: argparse.Namespace) -> List[Path]:
     if args.models:
-        models: Iterable[Path] = args.models
+        cwd = Path.cwd()
+        resolved: List[Path] = []
+        for model in args.models:
+            model_path = model if model.is_absolute() else cwd / model
+            if not os.path.isfile(model_path):
+                raise FileNotFoundError(f"Model file not found: {model_path}")
+            resolved.append(model_path)
     else:
         models_dir = resolve_path(args.models_dir)
         if not models_dir.exists():
             raise FileNotFoundError(f"Models directory not found: {models_dir}")
-        models = sorted(models_dir.glob(args.pattern))
-    resolved: List[Path] = []
-    for model in models:
-        resolved_path = resolve_path(model)
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Model file not found: {resolved_path}")
-        resolved.append(resolved_path)
+        # Glob results are absolute (models_dir is) and known to exist.
+        resolved = sorted(models_dir.glob(args.pattern))
     if not resolved:
         raise RuntimeError("No gesture model files were located.")
     return resolved
 
 
-def build_command(models: List[Path], args: argparse.Namespace) -> List[str]:
+def _identity(value: Any) -> Any:
+    return value
+
+
+# (namespace attribute, debug script flag, value transform) for optional pass-through options.
+_FLAG_MAP: List[Tuple[str, str, Callable[[Any], Any]]] = [
+    ("camera", "--camera", _identity),
+    ("max_hands", "--max-hands", _identity),
+    ("complexity", "--complexity", _identity),
+    ("min_detect", "--min-detect", _identity),
+    ("min_track", "--min-track", _identity),
+    ("save_log", "--save-log", resolve_path),
+    ("prob_threshold", "--prob-threshold", _identity),
+    ("smoothing_window", "--smoothing-window", _identity),
+    ("min_consensus", "--min-consensus", _identity),
+    ("max_history", "--max-history", _identity),
+    ("backend", "--backend", _identity),
+]
+
+
+def build_arguments(models: List[Path], args: argparse.Namespace) -> List[str]:
+    """Translate the launcher options into debug_gesture_recognition.py arguments."""
     config_path = resolve_path(args.config)
     cmd: List[str] = [
-        sys.executable,
-        str(DEBUG_SCRIPT),
         "--config",
         str(config_path),
     ]
 
-    if args.camera is not None:
-        cmd.extend(["--camera", str(args.camera)])
-    if args.max_hands is not None:
-        cmd.extend(["--max-hands", str(args.max_hands)])
-    if args.min_detect is not None:
-        cmd.extend(["--min-detect", str(args.min_detect)])
-    if args.min_track is not None:
-        cmd.extend(["--min-track", str(args.min_track)])
-    if args.save_log is not None:
-        cmd.extend(["--save-log", str(resolve_path(args.save_log))])
-    if args.prob_threshold is not None:
-        cmd.extend(["--prob-threshold", str(args.prob_threshold)])
-    if args.smoothing_window is not None:
-        cmd.extend(["--smoothing-window", str(args.smoothing_window)])
-    if args.min_consensus is not None:
-        cmd.extend(["--min-consensus", str(args.min_consensus)])
-    if args.max_history is not None:
-        cmd.extend(["--max-history", str(args.max_history)])
+    for attr, flag, transform in _FLAG_MAP:
+        value = getattr(args, attr)
+        if value is not None:
+            cmd += [flag, str(transform(value))]
 
     for model in models:
-        cmd.extend(["--model", str(model)])
+        cmd += ["--model", str(model)]
 
     return cmd
 
 
+def build_command(models: List[Path], args: argparse.Namespace) -> List[str]:
+    return [sys.executable, str(DEBUG_SCRIPT), *build_arguments(models, args)]
+
+
 def main() -> None:
     args = parse_args()
     models = collect_models(args)
-    cmd = build_command(models, args)
+    if args.isolated:
+        cmd = build_command(models, args)
+        if args.verbose:
+            print("Running:", " ".join(cmd))
+        subprocess.run(cmd, check=False)
+        return
+
+    # Imported lazily so --isolated runs never pay for loading MediaPipe here.
+    import cv2
+    from debug_gesture_recognition import (
+        create_hands,
+        main as debug_main,
+        parse_args as debug_parse_args,
+    )
+
+    debug_argv = build_arguments(models, args)
     if args.verbose:
-        print("Running:", " ".join(cmd))
-    subprocess.run(cmd, check=False)
+        print("Running in-process:", " ".join(debug_argv))
+    debug_args = debug_parse_args(debug_argv)
+
+    # The camera and the Hands graph (palm detection + landmark TFLite models)
+    # are created once here and shared by every model under comparison.
+    capture = cv2.VideoCapture(debug_args.camera, cv2.CAP_DSHOW)
+    if not capture or not capture.isOpened():
+        raise RuntimeError(f"Unable to open camera index {debug_args.camera}")
+    hands = create_hands(debug_args)
+    try:
+        debug_main(debug_args, shared_hands=hands, shared_capture=capture)
+    finally:
+        hands.close()
+        capture.release()
 
 
 if __name__ == "__main__":
@@ -3,26 +3,39 @@ from __future__ import annotations
 import argparse
 import sys
 import time
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
 
 import cv2
 import mediapipe as mp
+import numpy as np
+
+try:  # numba is optional; it JIT-compiles the per-hand bounding-box kernel
+    from numba import njit
+except ImportError:  # pragma: no cover - falls back to NumPy reductions
+    njit = None  # type: ignore[assignment]
 
 PROJECT_ROOT = Path(__file__).resolve().parents[0]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from gesture_recognizer import GestureRecognizer  # noqa: E402
+from camera_stream import CameraStream  # noqa: E402
+from gesture_recognizer import (  # noqa: E402
+    MODEL_BACKENDS,
+    GestureEvent,
+    GestureRecognizer,
+    landmarks_to_array,
+)
+from overlay_strip import OverlayStrip, TextLine  # noqa: E402
 
 
 drawing_utils = mp.solutions.drawing_utils
 drawing_styles = mp.solutions.drawing_styles
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Live preview of gesture recognition results using the current model and config."
     )
@@ -44,6 +57,13 @@ def parse_args() -> argparse.Namespace:
         default=2,
         help="Maximum number of hands to process",
     )
+    parser.add_argument(
+        "--complexity",
+        type=int,
+        choices=(0, 1),
+        default=0,
+        help="MediaPipe hand landmark model complexity: 0 = lite (faster), 1 = full (default: 0)",
+    )
     parser.add_argument(
         "--min-detect",
         type=float,
@@ -93,42 +113,155 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Override the maximum history size maintained for smoothing.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--backend",
+        choices=MODEL_BACKENDS,
+        default=None,
+        help=(
+            "Override the model inference backend: 'onnx' runs an exported <model>.onnx "
+            "(see onnx_export.py) through onnxruntime, 'sklearn' the joblib estimator, "
+            "'hummingbird' compiles it to torch with hummingbird-ml, "
+            "'auto' prefers ONNX when available."
+        ),
+    )
+    parser.add_argument(
+        "--compare-all",
+        action="store_true",
+        help=(
+            "Run every loaded model on each frame (in parallel threads) and show the other "
+            "models' predictions under the active one, instead of only the selected model."
+        ),
+    )
+    parser.add_argument(
+        "--input-size",
+        type=int,
+        default=256,
+        help=(
+            "Downscale frames so their longest side is at most this many pixels before hand "
+            "tracking, keeping the aspect ratio (default: 256, MediaPipe's landmark model input). "
+            "Raise it if distant hands stop being detected; use 0 to disable."
+        ),
+    )
+    parser.add_argument(
+        "--opencl",
+        action="store_true",
+        help=(
+            "Resize and colour-convert the hand-tracking input through OpenCV's OpenCL T-API "
+            "(cv2.UMat). Helps on large camera frames with a capable GPU; falls back to the CPU "
+            "when OpenCL is unavailable."
+        ),
+    )
+    parser.add_argument(
+        "--no-landmark-draw",
+        action="store_true",
+        help="Skip drawing the MediaPipe landmark skeleton on the preview.",
+    )
+    parser.add_argument(
+        "--fast-draw",
+        action="store_true",
+        help=(
+            "Draw the landmark skeleton with batched cv2.polylines calls instead of MediaPipe's "
+            "drawing_utils (plain colours, far fewer OpenCV calls per hand)."
+        ),
+    )
+    parser.add_argument(
+        "--infer-stride",
+        type=int,
+        default=2,
+        help=(
+            "Run MediaPipe hand tracking on every Nth frame and reuse its landmarks in between; "
+            "the classifier still runs every frame (default: 2, use 1 to track every frame)."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def create_hands(args: argparse.Namespace) -> Any:
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        model_complexity=args.complexity,
+        max_num_hands=args.max_hands,
+        min_detection_confidence=args.min_detect,
+        min_tracking_confidence=args.min_track,
+    )
 
 
-def append_log(log_path: Optional[Path], message: str) -> None:
-    if log_path is None:
-        return
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    with log_path.open("a", encoding="utf-8") as fh:
-        fh.write(f"[{timestamp}] {message}\n")
+class EventLog:
+    """Appends timestamped lines to ``path`` through one buffered handle.
+
+    The file stays open for the whole session; the timestamp string is only
+    reformatted when the wall-clock second changes.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self._fh: Optional[TextIO] = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = path.open("a", buffering=8192, encoding="utf-8")
+        self._stamp_second = -1
+        self._stamp = ""
+
+    def write(self, message: str) -> None:
+        if self._fh is None:
+            return
+        now = int(time.time())
+        if now != self._stamp_second:
+            self._stamp_second = now
+            self._stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        self._fh.write(f"[{self._stamp}] {message}\n")
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+RECENT_WINDOW = 180
 
 
 @dataclass
 class PerformanceStats:
     frame_count: int = 0
     total_duration: float = 0.0
-    recent_durations: deque[float] = field(default_factory=lambda: deque(maxlen=180))
     max_duration: float = 0.0
+    # Ring buffer of the last RECENT_WINDOW durations with a running sum, so the
+    # recent average is O(1) per frame instead of re-summing the window.
+    _recent: List[float] = field(default_factory=lambda: [0.0] * RECENT_WINDOW, repr=False)
+    _recent_index: int = 0
+    _recent_count: int = 0
+    _recent_sum: float = 0.0
 
     def record(self, duration: float) -> None:
         self.frame_count += 1
         self.total_duration += duration
-        self.recent_durations.append(duration)
+        index = self._recent_index
+        self._recent_sum += duration - self._recent[index]
+        self._recent[index] = duration
+        index = (index + 1) % RECENT_WINDOW
+        self._recent_index = index
+        if self._recent_count < RECENT_WINDOW:
+            self._recent_count += 1
+        if index == 0:
+            # Resync once per lap so floating-point drift in the running sum cannot build up.
+            self._recent_sum = sum(self._recent)
         if duration > self.max_duration:
             self.max_duration = duration
 
     @property
     def last_duration(self) -> Optional[float]:
-        if not self.recent_durations:
+        if not self._recent_count:
             return None
-        return self.recent_durations[-1]
+        return self._recent[self._recent_index - 1]
 
     @property
     def recent_average(self) -> Optional[float]:
-        if not self.recent_durations:
+        if not self._recent_count:
             return None
-        return sum(self.recent_durations) / len(self.recent_durations)
+        return self._recent_sum / self._recent_count
 
     @property
     def overall_average(self) -> Optional[float]:
@@ -144,11 +277,25 @@ class DebugModelOption:
     path: Optional[Path]
     metadata: Dict[str, Any]
     stats: PerformanceStats = field(default_factory=PerformanceStats)
+    header: OverlayStrip = field(default_factory=lambda: OverlayStrip(baseline=25))
+    score: Optional[str] = field(init=False, default=None)
+    _header_key: Optional[Tuple[int, int]] = field(init=False, default=None, repr=False)
+    _header_lines: Tuple[TextLine, ...] = field(init=False, default=(), repr=False)
+
+    def __post_init__(self) -> None:
+        self.score = _extract_overall_score(self.metadata) if self.metadata else None
 
     @property
     def resolved_path(self) -> Optional[Path]:
         return self.path or self.recognizer.model_path
 
+    def static_header_lines(self, slot: int, slot_count: int) -> Tuple[TextLine, ...]:
+        """Header lines that only depend on this model, built once per slot layout."""
+        if self._header_key != (slot, slot_count):
+            self._header_lines = _static_header_lines(self, slot, slot_count)
+            self._header_key = (slot, slot_count)
+        return self._header_lines
+
 
 def _build_model_options(args: argparse.Namespace) -> List[DebugModelOption]:
     config_path = args.config
@@ -166,6 +313,8 @@ def _build_model_options(args: argparse.Namespace) -> List[DebugModelOption]:
         shared_overrides["min_consensus"] = args.min_consensus
     if args.max_history is not None:
         shared_overrides["max_history"] = args.max_history
+    if args.backend is not None:
+        shared_overrides["backend"] = args.backend
 
     options: List[DebugModelOption] = []
     for index, model_path in enumerate(requested_models, start=1):
@@ -228,73 +377,154 @@ def _extract_overall_score(metadata: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def _landmarks_to_bbox(landmarks: Sequence[object], frame_shape: Tuple[int, int, int]) -> tuple[int, int, int, int]:
-    h, w = frame_shape[:2]
-    xs = [int(getattr(lm, "x", 0.0) * w) for lm in landmarks]
-    ys = [int(getattr(lm, "y", 0.0) * h) for lm in landmarks]
-    if not xs or not ys:
-        return 0, 0, w, h
-    min_x = max(min(xs) - 10, 0)
-    min_y = max(min(ys) - 10, 0)
-    max_x = min(max(xs) + 10, w)
-    max_y = min(max(ys) + 10, h)
+def _bbox_kernel(points: np.ndarray, w: int, h: int, margin: int) -> Tuple[int, int, int, int]:
+    low_x = high_x = points[0, 0]
+    low_y = high_y = points[0, 1]
+    for idx in range(1, points.shape[0]):
+        x = points[idx, 0]
+        y = points[idx, 1]
+        if x < low_x:
+            low_x = x
+        elif x > high_x:
+            high_x = x
+        if y < low_y:
+            low_y = y
+        elif y > high_y:
+            high_y = y
+    min_x = max(int(low_x * w) - margin, 0)
+    min_y = max(int(low_y * h) - margin, 0)
+    max_x = min(int(high_x * w) + margin, w)
+    max_y = min(int(high_y * h) + margin, h)
     return min_x, min_y, max_x, max_y
 
 
-def _format_top_predictions(recognizer: GestureRecognizer, landmarks, handed_label: str) -> list[str]:
-    classifier = recognizer.classifier
-    feature_extractor = getattr(recognizer, "_feature_extractor", None)
-    if classifier is None or feature_extractor is None:
-        return ["Classifier unavailable"]
+# No on-disk cache: this script runs as ``__main__`` but debug_all_models imports it
+# as ``debug_gesture_recognition``, and numba's cache entries only load under the
+# name that wrote them.
+_jit_bbox_kernel = njit(_bbox_kernel) if njit is not None else None
 
-    features = feature_extractor.extract(list(landmarks), handed_label)
-    if features is None:
-        return ["Feature extraction failed"]
 
-    predict_proba = getattr(classifier, "predict_proba", None)
-    base_classifier = getattr(classifier, "_classifier", None)
-    classes = getattr(classifier, "classes_", None)
+def _landmarks_to_bbox(points: np.ndarray, h: int, w: int) -> tuple[int, int, int, int]:
+    """Pixel bounding box (with a 10px margin) of an ``(N, 3)`` landmark array."""
+    if not len(points):
+        return 0, 0, w, h
+    if _jit_bbox_kernel is not None:
+        return _jit_bbox_kernel(points, w, h, 10)
+    xy = points[:, :2]
+    (low_x, low_y), (high_x, high_y) = xy.min(axis=0), xy.max(axis=0)
+    min_x = max(int(low_x * w) - 10, 0)
+    min_y = max(int(low_y * h) - 10, 0)
+    max_x = min(int(high_x * w) + 10, w)
+    max_y = min(int(high_y * h) + 10, h)
+    return min_x, min_y, max_x, max_y
 
-    if predict_proba is None and base_classifier is not None:
-        predict_proba = getattr(base_classifier, "predict_proba", None)
-        classes = getattr(base_classifier, "classes_", classes)
 
-    if predict_proba is None or classes is None:
-        return ["Classifier lacks probability support"]
+def _timed_process(
+    option: DebugModelOption,
+    hand_landmarks: Optional[Sequence[object]],
+    handedness: Optional[Sequence[object]],
+) -> Tuple[List[GestureEvent], List[str]]:
+    # Timed here rather than around the pool submit so queueing is not counted.
+    start_ts = time.perf_counter()
+    output = option.recognizer.process(hand_landmarks, handedness)
+    option.stats.record(time.perf_counter() - start_ts)
+    return output
+
+
+def _draw_hand_fast(
+    frame: np.ndarray, points: np.ndarray, connection_index: np.ndarray, h: int, w: int
+) -> None:
+    """Draw a hand skeleton with two OpenCV calls instead of one per landmark and bone."""
+    pixels = (points[:, :2] * (w, h)).astype(np.int32)
+    cv2.polylines(frame, pixels[connection_index], False, (255, 255, 255), 2, cv2.LINE_AA)
+    # A one-point polyline with a thick stroke renders as a dot.
+    cv2.polylines(frame, pixels.reshape(-1, 1, 2), True, (0, 0, 255), 5, cv2.LINE_AA)
+
+
+def _static_header_lines(
+    option: DebugModelOption, slot: int, slot_count: int
+) -> Tuple[TextLine, ...]:
+    recognizer = option.recognizer
+    lines = [
+        "[Gesture Debug] press Q or ESC to exit" + (
+            " | press M to cycle models" if slot_count > 1 else ""
+        ),
+        f"Model slot {slot + 1}/{slot_count}: {option.name}",
+        f"Model loaded: {'yes' if recognizer.enabled else 'NO'}",
+    ]
+    backend = getattr(recognizer.classifier, "backend", None)
+    if backend:
+        lines.append(f"Backend: {backend}")
+
+    model_path = option.resolved_path
+    if model_path:
+        lines.append(f"Model file: {model_path.name}")
+
+    metadata = option.metadata
+    if metadata:
+        model_type = metadata.get("model_type")
+        if model_type:
+            lines.append(f"Model type: {model_type}")
+    if option.score is not None:
+        lines.append(f"Hold-out score: {option.score}")
+
+    prob_threshold = getattr(recognizer, "_probability_threshold", None)
+    if prob_threshold is not None:
+        lines.append(f"Confidence threshold: {prob_threshold:0.2f}")
+
+    smoothing = getattr(recognizer, "_smoothing_window", None)
+    min_consensus = getattr(recognizer, "_min_consensus", None)
+    max_history = getattr(recognizer, "_max_history", None)
+    smoothing_bits = []
+    if smoothing is not None:
+        smoothing_bits.append(f"window={smoothing}")
+    if min_consensus is not None:
+        smoothing_bits.append(f"min_consensus={min_consensus}")
+    if max_history is not None:
+        smoothing_bits.append(f"max_history={max_history}")
+    if smoothing_bits:
+        lines.append("Smoothing: " + ", ".join(smoothing_bits))
+
+    return tuple(
+        (text, 0.6, (0, 255, 0)) if idx == 0 else (text, 0.55, (200, 255, 200))
+        for idx, text in enumerate(lines)
+    )
 
-    try:
-        proba_row = predict_proba([features])[0]
-    except Exception as exc:  # pragma: no cover - defensive
-        return [f"predict_proba error: {exc}"]
 
-    try:
-        proba_iter = list(float(score) for score in proba_row)
-    except Exception:  # pragma: no cover - fallback
+def _format_top_predictions(recognizer: GestureRecognizer, handed_label: str) -> list[str]:
+    classifier = recognizer.classifier
+    if classifier is None:
+        return ["Classifier unavailable"]
+
+    # Reuse the probabilities recognizer.process() already computed for this hand.
+    proba = recognizer.get_last_proba(handed_label)
+    if proba is None:
+        return ["No prediction for this hand"]
+
+    proba_row = np.asarray(proba, dtype=float).ravel()
+    labels = classifier.class_labels
+    if proba_row.size == 0 or len(labels) != proba_row.size:
         return ["Probability output unrecognized"]
 
-    label_encoder = getattr(classifier, "_label_encoder", None) or getattr(recognizer, "_label_encoder", None)
+    top_k = min(3, proba_row.size)
+    top = np.argpartition(proba_row, -top_k)[-top_k:]
+    top = top[np.argsort(-proba_row[top])]
+    return [f"{labels[idx]}: {proba_row[idx]:0.2f}" for idx in top]
 
-    indexed = sorted(((score, idx) for idx, score in enumerate(proba_iter)), reverse=True)
-    top = indexed[:3]
-    lines: list[str] = []
-    for score, idx in top:
-        try:
-            encoded = classes[idx]
-        except Exception:
-            encoded = idx
-        if label_encoder is not None:
-            try:
-                label = label_encoder.inverse_transform([encoded])[0]
-            except Exception:
-                label = str(encoded)
-        else:
-            label = str(encoded)
-        lines.append(f"{label}: {score:0.2f}")
-    return lines if lines else ["No classes"]
 
+def main(
+    args: Optional[argparse.Namespace] = None,
+    *,
+    shared_hands: Optional[Any] = None,
+    shared_capture: Optional[Any] = None,
+) -> None:
+    """Run the preview window.
 
-def main() -> None:
-    args = parse_args()
+    ``shared_hands`` and ``shared_capture`` let a caller reuse an already
+    initialised MediaPipe ``Hands`` graph and camera; they are left open on exit.
+    """
+    if args is None:
+        args = parse_args()
 
     try:
         model_options = _build_model_options(args)
@@ -316,9 +546,8 @@ def main() -> None:
         samples = metadata.get("samples") if isinstance(metadata, dict) else None
         if samples:
             summary_bits.append(f"samples={samples}")
-        score = _extract_overall_score(metadata) if metadata else None
-        if score is not None:
-            summary_bits.append(f"score={score}")
+        if option.score is not None:
+            summary_bits.append(f"score={option.score}")
         if not summary_bits:
             summary_bits.append("no metadata")
         print(f"  [{idx}] {option.name}: {path_display} ({', '.join(summary_bits)})")
@@ -331,16 +560,46 @@ def main() -> None:
     if not recognizer.enabled:
         print("WARNING: Gesture classifier not loaded. Check the model path in gestures.yml or CLI overrides.")
 
-    capture = cv2.VideoCapture(args.camera, cv2.CAP_DSHOW)
-    if not capture or not capture.isOpened():
-        raise RuntimeError(f"Unable to open camera index {args.camera}")
-
-    hands = mp.solutions.hands.Hands(
-        max_num_hands=args.max_hands,
-        min_detection_confidence=args.min_detect,
-        min_tracking_confidence=args.min_track,
-    )
-
+    capture = shared_capture
+    if capture is None:
+        capture = cv2.VideoCapture(args.camera, cv2.CAP_DSHOW)
+        if not capture or not capture.isOpened():
+            raise RuntimeError(f"Unable to open camera index {args.camera}")
+    # A one-frame driver queue plus the background reader keep the preview on
+    # the newest frame while MediaPipe and the classifier are busy.
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    stream = CameraStream(capture).start()
+
+    hands = shared_hands
+    if hands is None:
+        hands = create_hands(args)
+
+    rgb_buffer: Optional[np.ndarray] = None
+    use_opencl = False
+    if args.opencl:
+        use_opencl = cv2.ocl.haveOpenCL()
+        if use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            use_opencl = cv2.ocl.useOpenCL()
+        if not use_opencl:
+            print("WARNING: OpenCL is not available to OpenCV; preprocessing stays on the CPU.")
+    infer_stride = max(1, args.infer_stride)
+    event_log = EventLog(args.save_log)
+    pool: Optional[ThreadPoolExecutor] = None
+    if args.compare_all and len(model_options) > 1:
+        pool = ThreadPoolExecutor(max_workers=len(model_options), thread_name_prefix="gesture-model")
+    frame_index = 0
+    results: Optional[Any] = None
+    landmark_buffer = np.empty((21, 3), dtype=np.float32)
+    # The style getters build fresh DrawingSpec dicts on every call; build them once.
+    hand_connections = mp.solutions.hands.HAND_CONNECTIONS
+    landmark_style = drawing_styles.get_default_hand_landmarks_style()
+    connection_style = drawing_styles.get_default_hand_connections_style()
+    connection_index: Optional[np.ndarray] = None
+    if args.fast_draw:
+        connection_index = np.array(sorted(hand_connections), dtype=np.intp)
+    poll_key = getattr(cv2, "pollKey", None)  # OpenCV >= 4.5
+    last_wait_key = 0.0
     window_name = "Gesture Debug Preview"
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
 
@@ -349,23 +608,69 @@ def main() -> None:
             active_option = model_options[active_index]
             recognizer = active_option.recognizer
 
-            success, frame = capture.read()
+            success, frame = stream.read()
             if not success:
                 print("Warning: failed to read frame from camera")
                 time.sleep(0.05)
                 continue
 
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = hands.process(rgb)
-
-            start_ts = time.perf_counter()
-            events, overlays = recognizer.process(
-                results.multi_hand_landmarks,
-                results.multi_handedness,
-            )
-            duration = time.perf_counter() - start_ts
-            active_option.stats.record(duration)
+            # The stream hands each frame out once, so it can be mirrored in place.
+            cv2.flip(frame, 1, dst=frame)
+            frame_h, frame_w = frame.shape[:2]
+            # Landmarks from the last MediaPipe pass are reused on the frames in between.
+            if results is None or frame_index % infer_stride == 0:
+                # MediaPipe works on small inputs anyway; shrink before converting so both
+                # steps touch fewer pixels. Landmarks are normalized, so the full-size
+                # frame can still be annotated with them.
+                longest = max(frame_h, frame_w)
+                inference_size: Optional[Tuple[int, int]] = None
+                if 0 < args.input_size < longest:
+                    inference_size = (
+                        max(1, round(frame_w * args.input_size / longest)),
+                        max(1, round(frame_h * args.input_size / longest)),
+                    )
+                if use_opencl:
+                    # Upload once, resize + convert on the OpenCL device, download the small result.
+                    frame_u = cv2.UMat(frame)
+                    if inference_size is not None:
+                        frame_u = cv2.resize(frame_u, inference_size, interpolation=cv2.INTER_AREA)
+                    rgb_input = cv2.cvtColor(frame_u, cv2.COLOR_BGR2RGB).get()
+                else:
+                    inference_frame = frame
+                    if inference_size is not None:
+                        inference_frame = cv2.resize(frame, inference_size, interpolation=cv2.INTER_AREA)
+                    if rgb_buffer is None or rgb_buffer.shape != inference_frame.shape:
+                        rgb_buffer = np.empty_like(inference_frame)
+                    rgb_buffer.flags.writeable = True
+                    cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+                    rgb_input = rgb_buffer
+                # Read-only input lets MediaPipe use the buffer without a defensive copy.
+                rgb_input.flags.writeable = False
+                results = hands.process(rgb_input)
+            frame_index += 1
+
+            if pool is not None:
+                # Every model sees the same landmarks; sklearn releases the GIL in its
+                # numeric kernels, so the recognizers overlap on separate cores.
+                futures = {
+                    idx: pool.submit(
+                        _timed_process,
+                        option,
+                        results.multi_hand_landmarks,
+                        results.multi_handedness,
+                    )
+                    for idx, option in enumerate(model_options)
+                }
+                all_outputs = {idx: future.result() for idx, future in futures.items()}
+            else:
+                all_outputs = {
+                    active_index: _timed_process(
+                        active_option,
+                        results.multi_hand_landmarks,
+                        results.multi_handedness,
+                    )
+                }
+            events, overlays = all_outputs[active_index]
 
             hand_count = len(results.multi_hand_landmarks) if results.multi_hand_landmarks else 0
 
@@ -373,25 +678,32 @@ def main() -> None:
                 for hand_landmarks, handedness in zip(
                     results.multi_hand_landmarks, results.multi_handedness
                 ):
-                    drawing_utils.draw_landmarks(
-                        frame,
-                        hand_landmarks,
-                        mp.solutions.hands.HAND_CONNECTIONS,
-                        drawing_styles.get_default_hand_landmarks_style(),
-                        drawing_styles.get_default_hand_connections_style(),
-                    )
-
                     classification = handedness.classification[0]
-                    land_list = hand_landmarks.landmark
+                    points = landmarks_to_array(hand_landmarks, out=landmark_buffer)
+                    if points is None:
+                        points = landmarks_to_array(hand_landmarks)
+
+                    if args.no_landmark_draw:
+                        pass
+                    elif connection_index is not None and len(points) == 21:
+                        _draw_hand_fast(frame, points, connection_index, frame_h, frame_w)
+                    else:
+                        drawing_utils.draw_landmarks(
+                            frame,
+                            hand_landmarks,
+                            hand_connections,
+                            landmark_style,
+                            connection_style,
+                        )
 
-                    x1, y1, x2, y2 = _landmarks_to_bbox(land_list, tuple(frame.shape))
+                    x1, y1, x2, y2 = _landmarks_to_bbox(points, frame_h, frame_w)
                     cv2.rectangle(frame, (x1, y1), (x2, y2), (60, 180, 255), 1)
 
                     info_lines = [
                         f"Hand: {classification.label} score={classification.score:0.2f}",
                     ]
                     info_lines.extend(
-                        _format_top_predictions(recognizer, land_list, classification.label)
+                        _format_top_predictions(recognizer, classification.label)
                     )
 
                     for idx, line in enumerate(info_lines):
@@ -406,27 +718,11 @@ def main() -> None:
                             cv2.LINE_AA,
                         )
 
-            header_lines = [
-                "[Gesture Debug] press Q or ESC to exit" + (
-                    " | press M to cycle models" if len(model_options) > 1 else ""
-                ),
-                f"Hands detected: {hand_count}",
-                f"Model slot {active_index + 1}/{len(model_options)}: {active_option.name}",
-                f"Model loaded: {'yes' if recognizer.enabled else 'NO'}",
-            ]
-
-            model_path = active_option.resolved_path
-            if model_path:
-                header_lines.append(f"Model file: {model_path.name}")
-
-            metadata = active_option.metadata
-            if metadata:
-                model_type = metadata.get("model_type")
-                if model_type:
-                    header_lines.append(f"Model type: {model_type}")
-                score = _extract_overall_score(metadata)
-                if score is not None:
-                    header_lines.append(f"Hold-out score: {score}")
+            # Lines that only change with the model or its settings come from a cached strip.
+            static_lines = active_option.static_header_lines(active_index, len(model_options))
+            active_option.header.draw(frame, static_lines)
+
+            header_lines = [f"Hands detected: {hand_count}"]
 
             stats = active_option.stats
             last_duration = stats.last_duration
@@ -445,49 +741,48 @@ def main() -> None:
                 overall = stats.overall_average or 0.0
                 header_lines.append(f"Latency: avg={overall * 1000.0:0.2f} ms")
 
-            prob_threshold = getattr(recognizer, "_probability_threshold", None)
-            if prob_threshold is not None:
-                header_lines.append(f"Confidence threshold: {prob_threshold:0.2f}")
-
-            smoothing = getattr(recognizer, "_smoothing_window", None)
-            min_consensus = getattr(recognizer, "_min_consensus", None)
-            max_history = getattr(recognizer, "_max_history", None)
-            smoothing_bits = []
-            if smoothing is not None:
-                smoothing_bits.append(f"window={smoothing}")
-            if min_consensus is not None:
-                smoothing_bits.append(f"min_consensus={min_consensus}")
-            if max_history is not None:
-                smoothing_bits.append(f"max_history={max_history}")
-            if smoothing_bits:
-                header_lines.append("Smoothing: " + ", ".join(smoothing_bits))
-
             if overlays:
                 header_lines.extend(overlays)
             else:
                 header_lines.append("Overlay: (no stable predictions yet)")
 
-            for idx, text in enumerate(header_lines):
+            if pool is not None:
+                for idx, (_, other_overlays) in all_outputs.items():
+                    if idx != active_index:
+                        summary = " | ".join(other_overlays) or "(no stable predictions yet)"
+                        header_lines.append(f"[{model_options[idx].name}] {summary}")
+
+            for idx, text in enumerate(header_lines, start=len(static_lines)):
                 cv2.putText(
                     frame,
                     text,
                     (10, 25 + idx * 20),
                     cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6 if idx == 0 else 0.55,
-                    (0, 255, 0) if idx == 0 else (200, 255, 200),
+                    0.55,
+                    (200, 255, 200),
                     1,
                     cv2.LINE_AA,
                 )
 
+            if pool is not None:
+                for idx, (other_events, _) in all_outputs.items():
+                    if idx == active_index:
+                        continue
+                    for event in other_events:
+                        event_log.write(
+                            f"{model_options[idx].name} | {event.change.upper()}: {event.event} "
+                            f"({event.label}) conf={event.confidence:0.2f}",
+                        )
+
             for event_idx, event in enumerate(events):
                 status = (
                     f"{event.change.upper()}: {event.event} ({event.label}) conf={event.confidence:0.2f}"
                 )
-                append_log(args.save_log, f"{active_option.name} | {status}")
+                event_log.write(f"{active_option.name} | {status}")
                 cv2.putText(
                     frame,
                     status,
-                    (10, frame.shape[0] - 10 - event_idx * 20),
+                    (10, frame_h - 10 - event_idx * 20),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     0.55,
                     (0, 200, 255) if event.change == "start" else (200, 200, 200),
@@ -496,13 +791,22 @@ def main() -> None:
                 )
 
             cv2.imshow(window_name, frame)
-            key = cv2.waitKey(1) & 0xFF
+            # pollKey never sleeps (waitKey(1) can round up to a 15 ms timer tick on
+            # Windows); a real waitKey once a second keeps HighGUI's event loop serviced.
+            now = time.monotonic()
+            if poll_key is not None and now - last_wait_key < 1.0:
+                key = poll_key() & 0xFF
+            else:
+                key = cv2.waitKey(1) & 0xFF
+                last_wait_key = now
             if key in (ord("q"), 27):
                 break
             if key in (ord("m"), ord("M")) and len(model_options) > 1:
+                event_log.flush()
                 previous_option = model_options[active_index]
                 active_index = (active_index + 1) % len(model_options)
-                model_options[active_index].recognizer.reset()
+                if pool is None:
+                    model_options[active_index].recognizer.reset()
                 prev_stats = previous_option.stats
                 if prev_stats.frame_count:
                     avg_ms = (prev_stats.overall_average or 0.0) * 1000.0
@@ -517,8 +821,14 @@ def main() -> None:
                 continue
 
     finally:
-        hands.close()
-        capture.release()
+        if pool is not None:
+            pool.shutdown(wait=True)
+        event_log.close()
+        stream.stop()
+        if shared_hands is None:
+            hands.close()
+        if shared_capture is None:
+            capture.release()
         cv2.destroyWindow(window_name)
         print("\nLatency summary by model:")
         for option in model_options:
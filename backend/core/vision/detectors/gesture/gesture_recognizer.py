@@ -1,23 +1,18 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
 import math
-from collections import Counter, deque
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, cast
-
-import yaml
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union, cast
 
 if TYPE_CHECKING:  # pragma: no cover - import hints only during type-checking
-    import joblib as joblib_type
     import numpy as np_type
 
-try:  # Optional heavy dependencies are imported lazily when available
-    import joblib
-except ImportError:  # pragma: no cover - handled gracefully at runtime
-    joblib = None  # type: ignore[assignment]
-
 try:  # numpy is optional but useful for ML workflows
     import numpy as np
 except ImportError:  # pragma: no cover - handled gracefully at runtime
@@ -25,6 +20,22 @@ except ImportError:  # pragma: no cover - handled gracefully at runtime
 
 logger = logging.getLogger(__name__)
 
+MODEL_BACKENDS = ("auto", "sklearn", "onnx", "hummingbird")
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_module(name: str) -> Any:
+    """Import ``name`` on first use, or return ``None`` when it is not installed.
+
+    joblib (with the scikit-learn stack it unpickles), onnxruntime and numba are
+    only needed once a model is loaded, so deferring them keeps importing this
+    module cheap when gestures are disabled.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 
 @dataclass(frozen=True)
 class GestureActionConfig:
@@ -51,9 +62,33 @@ class HandPrediction:
     confidence: float
 
 
-@dataclass
+# Hand names in slot order for ``HandPredictions``.
+HAND_SLOTS = ("Left", "Right")
+
+
+class HandPredictions(NamedTuple):
+    """Per-frame predictions in fixed left/right slots; ``None`` when that hand is absent."""
+
+    left: Optional[HandPrediction] = None
+    right: Optional[HandPrediction] = None
+
+    @classmethod
+    def from_mapping(cls, predictions: Mapping[str, HandPrediction]) -> "HandPredictions":
+        """Build slots from a ``{"Left": ..., "Right": ...}`` mapping (case-insensitive)."""
+        slots: List[Optional[HandPrediction]] = [None, None]
+        for hand_label, prediction in predictions.items():
+            hand = hand_label.capitalize()
+            if hand in HAND_SLOTS:
+                slots[HAND_SLOTS.index(hand)] = prediction
+        return cls(*slots)
+
+
+@dataclass(frozen=True)
 class GestureEvent:
-    """Gesture state change produced by the recognizer."""
+    """Gesture state change produced by the recognizer.
+
+    Frozen because "end" events are pre-built once per gesture and shared.
+    """
 
     change: str  # "start" or "end"
     event: str
@@ -66,6 +101,15 @@ def _default_project_root() -> Path:
     return Path(__file__).resolve().parents[0]
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a gesture YAML file once per file version; callers must not mutate the result."""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.safe_load(fh) or {}
+
+
 def load_gesture_config(config_path: Optional[Path | str] = None) -> Dict[str, Any]:
     """Load the YAML configuration describing the gesture recognizer."""
 
@@ -80,8 +124,7 @@ def load_gesture_config(config_path: Optional[Path | str] = None) -> Dict[str, A
 
     config: Dict[str, Any]
     if candidate.exists():
-        with candidate.open("r", encoding="utf-8") as fh:
-            config = yaml.safe_load(fh) or {}
+        config = _read_config_file(str(candidate), candidate.stat().st_mtime_ns)
     else:
         logger.warning("Gesture config not found at %s. Using defaults.", candidate)
         config = {}
@@ -104,6 +147,9 @@ def load_gesture_config(config_path: Optional[Path | str] = None) -> Dict[str, A
     }
 
 
+_NO_HANDS = HandPredictions()
+
+
 class GestureActionManager:
     """Tracks gesture state transitions with temporal debouncing."""
 
@@ -111,8 +157,29 @@ class GestureActionManager:
         self._configs: List[GestureActionConfig] = list(configs)
         self._hold_counts: Dict[str, int] = {cfg.event: 0 for cfg in self._configs}
         self._active_events: Dict[str, GestureActionConfig] = {}
-
-    def update(self, predictions: Dict[str, HandPrediction]) -> List[GestureEvent]:
+        # Slots each gesture inspects and, for restricted two-hand gestures, how many
+        # allowed hands must match; computed once instead of on every frame.
+        self._hand_slots: Dict[str, Tuple[int, ...]] = {}
+        self._allowed_counts: Dict[str, int] = {}
+        for cfg in self._configs:
+            allowed = frozenset(cfg.normalized_allowed_hands() or ())
+            self._hand_slots[cfg.event] = tuple(
+                slot for slot, hand in enumerate(HAND_SLOTS) if not allowed or hand in allowed
+            )
+            self._allowed_counts[cfg.event] = len(allowed)
+        # Keyed by config identity, since several configs may share an event name.
+        self._end_events: Dict[int, GestureEvent] = {
+            id(cfg): GestureEvent(
+                change="end", event=cfg.event, label=cfg.label, confidence=0.0, overlay=cfg.overlay
+            )
+            for cfg in self._configs
+        }
+
+    def update(
+        self, predictions: Union[HandPredictions, Mapping[str, HandPrediction]]
+    ) -> List[GestureEvent]:
+        if not isinstance(predictions, HandPredictions):
+            predictions = HandPredictions.from_mapping(predictions)
         events: List[GestureEvent] = []
         for cfg in self._configs:
             matches = self._matching_hands(cfg, predictions)
@@ -137,36 +204,25 @@ class GestureActionManager:
                 self._active_events[cfg.event] = cfg
             elif is_active and not matches:
                 prev_cfg = self._active_events.pop(cfg.event)
-                events.append(
-                    GestureEvent(
-                        change="end",
-                        event=prev_cfg.event,
-                        label=prev_cfg.label,
-                        confidence=0.0,
-                        overlay=prev_cfg.overlay,
-                    )
-                )
+                events.append(self._end_events[id(prev_cfg)])
         return events
 
     def _matching_hands(
-        self, cfg: GestureActionConfig, predictions: Dict[str, HandPrediction]
+        self, cfg: GestureActionConfig, predictions: HandPredictions
     ) -> List[Tuple[str, HandPrediction]]:
-        allowed = cfg.normalized_allowed_hands()
         matched: List[Tuple[str, HandPrediction]] = []
-        for hand_label, prediction in predictions.items():
-            if prediction.label != cfg.label:
-                continue
-            if allowed is not None and hand_label.capitalize() not in allowed:
-                continue
-            matched.append((hand_label.capitalize(), prediction))
+        for slot in self._hand_slots[cfg.event]:
+            prediction = predictions[slot]
+            if prediction is not None and prediction.label == cfg.label:
+                matched.append((HAND_SLOTS[slot], prediction))
 
         if cfg.hands_required <= 1:
-            return matched[:1] if matched else []
+            return matched[:1]
 
-        if allowed:
-            if all(any(hand == needed for hand, _ in matched) for needed in allowed):
-                return [(hand, pred) for hand, pred in matched if hand in allowed]
-            return []
+        allowed_count = self._allowed_counts[cfg.event]
+        if allowed_count:
+            # Every allowed hand has to show the gesture.
+            return matched if len(matched) == allowed_count else []
 
         return matched if len(matched) >= cfg.hands_required else []
 
@@ -185,69 +241,376 @@ class GestureActionManager:
         self._active_events.clear()
 
 
+def landmarks_to_array(landmarks: Any, out: Optional["np_type.ndarray"] = None) -> Optional["np_type.ndarray"]:
+    """Copy MediaPipe landmark x/y/z values into an ``(N, 3)`` float32 array.
+
+    Accepts a ``NormalizedLandmarkList`` or any sequence of landmark objects.
+    When ``out`` is given it is filled in place; ``None`` is returned if its
+    row count does not match the number of landmarks.
+    """
+    if np is None:
+        raise ImportError("numpy is required to convert landmarks to arrays")
+    points = getattr(landmarks, "landmark", landmarks)
+    count = len(points)
+    if out is None:
+        out = np.empty((count, 3), dtype=np.float32)
+    elif out.shape[0] != count:
+        return None
+    for idx, lm in enumerate(points):
+        out[idx, 0] = lm.x
+        out[idx, 1] = lm.y
+        out[idx, 2] = lm.z
+    return out
+
+
+def raw_landmark_columns(count: int = 21) -> List[str]:
+    """Column names used for raw landmark datasets (``x0, y0, z0, x1, ...``)."""
+    return [f"{axis}{idx}" for idx in range(count) for axis in ("x", "y", "z")]
+
+
+_ANCHOR_INDICES = (5, 9, 13, 17)
+
+
+def handedness_flag(handedness_label: str) -> float:
+    """Feature value encoding the hand: ``1.0`` for a left hand, ``0.0`` otherwise."""
+    return 1.0 if str(handedness_label).lower() == "left" else 0.0
+
+
+def _extract_kernel(points, hand_flag, out):
+    """Fill ``out`` with wrist-relative, scale-normalised coordinates plus the hand flag."""
+    wx = points[0, 0]
+    wy = points[0, 1]
+    wz = points[0, 2]
+    total = 0.0
+    for idx in _ANCHOR_INDICES:
+        dx = points[idx, 0] - wx
+        dy = points[idx, 1] - wy
+        dz = points[idx, 2] - wz
+        total += math.sqrt(dx * dx + dy * dy + dz * dz)
+    scale = max(total / len(_ANCHOR_INDICES), 1e-3)
+    for row in range(points.shape[0]):
+        out[row * 3] = (points[row, 0] - wx) / scale
+        out[row * 3 + 1] = (points[row, 1] - wy) / scale
+        out[row * 3 + 2] = (points[row, 2] - wz) / scale
+    out[points.shape[0] * 3] = hand_flag
+    return scale
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_extract_kernel() -> Any:
+    """``_extract_kernel`` compiled with numba, or ``None`` when numba is not installed."""
+    numba = _optional_module("numba")
+    # No on-disk cache: this module is imported both as ``gesture_recognizer`` (the
+    # scripts) and as ``core.vision.detectors.gesture.gesture_recognizer`` (the
+    # backend), and numba's cache entries only load under the name that wrote them.
+    return numba.njit(fastmath=True)(_extract_kernel) if numba is not None else None
+
+
 class GestureFeatureExtractor:
     """Converts raw landmarks to a normalized feature vector for classification."""
 
-    _ANCHOR_INDICES = (5, 9, 13, 17)
+    _ANCHOR_INDICES = _ANCHOR_INDICES
+    # Fancy-index array for the anchors, built once rather than from the tuple per frame.
+    _ANCHOR_IDX = np.array(_ANCHOR_INDICES, dtype=np.intp) if np is not None else None
+
+    def warmup(self) -> None:
+        """Compile the JIT feature kernel up front so the first frame does not stall."""
+        if np is None or _jit_extract_kernel() is None:
+            return
+        self._extract_array(np.zeros((21, 3), dtype=np.float32), 1.0)
+
+    def extract(
+        self,
+        landmarks: Any,
+        hand_flag: float,
+        out: Optional["np_type.ndarray"] = None,
+    ) -> Optional[Union[List[float], "np_type.ndarray"]]:
+        """Build features from a sized iterable of landmark objects or a ``(21, 3)`` array.
+
+        ``hand_flag`` is the handedness feature (see :func:`handedness_flag`).
+
+        Returns a float32 vector (a plain list only when numpy is unavailable).
+        When ``out`` (a float32 vector of the feature length) is given, the
+        features are written into it and ``out`` is returned.
+        """
+        if np is not None and isinstance(landmarks, np.ndarray):
+            return self._extract_array(landmarks, hand_flag, out)
 
-    def extract(self, landmarks: Sequence[object], handedness_label: str) -> Optional[List[float]]:
         if landmarks is None or len(landmarks) < 21:
             return None
 
+        if np is not None:
+            # Gather every coordinate in one pass and normalise with array ops.
+            try:
+                points = np.fromiter(
+                    (value for lm in landmarks for value in (lm.x, lm.y, lm.z)),
+                    dtype=np.float32,
+                    count=len(landmarks) * 3,
+                ).reshape(-1, 3)
+            except (AttributeError, TypeError):
+                return None
+            return self._extract_array(points, hand_flag, out)
+
         try:
-            wrist = landmarks[0]
-        except (IndexError, TypeError):
+            wx, wy, wz = landmarks[0].x, landmarks[0].y, landmarks[0].z
+            coords = [(lm.x - wx, lm.y - wy, lm.z - wz) for lm in landmarks]
+        except (AttributeError, TypeError):
             return None
+        anchor_total = sum(math.hypot(*coords[idx]) for idx in self._ANCHOR_INDICES)
+        base_scale = max(anchor_total / len(self._ANCHOR_INDICES), 1e-3)
+        features = [value / base_scale for row in coords for value in row]
+        features.append(hand_flag)
+        return features
 
-        base_scale = self._compute_scale(landmarks, wrist)
-        if base_scale <= 1e-6:
-            return None
+    def extract_batch(
+        self,
+        points: "np_type.ndarray",
+        handedness_labels: Sequence[str],
+    ) -> "np_type.ndarray":
+        """Vectorised :meth:`extract` over ``(N, 21, 3)`` landmarks; returns ``(N, 64)`` float32."""
+        if np is None:
+            raise ImportError("numpy is required for batched feature extraction")
+        coords = np.asarray(points, dtype=np.float32)
+        if coords.ndim != 3 or coords.shape[1] < 21 or coords.shape[2] < 3:
+            raise ValueError(f"Expected landmarks shaped (N, 21, 3), got {coords.shape}")
+        if len(handedness_labels) != coords.shape[0]:
+            raise ValueError("handedness_labels must have one entry per landmark set")
+        coords = coords[:, :, :3] - coords[:, 0:1, :3]
+        anchors = coords[:, self._ANCHOR_IDX]
+        scale = np.maximum(np.linalg.norm(anchors, axis=2).mean(axis=1), 1e-3)
+        coords /= scale[:, None, None]
+
+        features = np.empty((coords.shape[0], coords.shape[1] * 3 + 1), dtype=np.float32)
+        features[:, :-1] = coords.reshape(coords.shape[0], -1)
+        features[:, -1] = [handedness_flag(label) for label in handedness_labels]
+        return features
 
-        features: List[float] = []
-        for lm in landmarks:
-            dx = (getattr(lm, "x", 0.0) - getattr(wrist, "x", 0.0)) / base_scale
-            dy = (getattr(lm, "y", 0.0) - getattr(wrist, "y", 0.0)) / base_scale
-            dz = (getattr(lm, "z", 0.0) - getattr(wrist, "z", 0.0)) / base_scale
-            features.extend((dx, dy, dz))
+    def _extract_array(
+        self,
+        points: "np_type.ndarray",
+        hand_flag: float,
+        out: Optional["np_type.ndarray"] = None,
+    ) -> Optional["np_type.ndarray"]:
+        if points.ndim != 2 or points.shape[0] < 21 or points.shape[1] < 3:
+            return None
+        if out is not None and out.shape[0] != points.shape[0] * 3 + 1:
+            return None
+        kernel = _jit_extract_kernel()
+        if kernel is not None:
+            coords32 = np.ascontiguousarray(points[:, :3], dtype=np.float32)
+            target = out if out is not None else np.empty(coords32.shape[0] * 3 + 1, dtype=np.float32)
+            kernel(coords32, hand_flag, target)
+            return target
 
-        hand_flag = 1.0 if handedness_label.lower() == "left" else 0.0
-        features.append(hand_flag)
-        return features
+        coords = points[:, :3]
+        wrist = coords[0]
+        anchors = coords[self._ANCHOR_IDX]
+        base_scale = max(float(np.linalg.norm(anchors - wrist, axis=1).mean()), 1e-3)
 
-    def _compute_scale(self, landmarks: Sequence[object], wrist: object) -> float:
-        distances: List[float] = []
-        wx = getattr(wrist, "x", 0.0)
-        wy = getattr(wrist, "y", 0.0)
-        wz = getattr(wrist, "z", 0.0)
-        for idx in self._ANCHOR_INDICES:
-            try:
-                anchor = landmarks[idx]
-            except (IndexError, TypeError):
-                continue
-            dx = getattr(anchor, "x", 0.0) - wx
-            dy = getattr(anchor, "y", 0.0) - wy
-            dz = getattr(anchor, "z", 0.0) - wz
-            distances.append(math.sqrt(dx * dx + dy * dy + dz * dz))
-        if not distances:
-            return 1.0
-        return max(sum(distances) / len(distances), 1e-3)
+        if out is None:
+            out = np.empty(coords.shape[0] * 3 + 1, dtype=np.float32)
+        np.divide(coords - wrist, base_scale, out=out[:-1].reshape(-1, 3))
+        out[-1] = hand_flag
+        return out
 
 
 class BaseGestureClassifier:
+    # Decoded label for each probability column, in ``classes_`` order.
+    class_labels: List[str] = []
+
     def predict(self, features: Sequence[float]) -> Tuple[Optional[str], float]:
         raise NotImplementedError
 
+    def predict_proba(self, feature_matrix: Sequence[Sequence[float]]):
+        raise NotImplementedError
 
-class MLGestureClassifier(BaseGestureClassifier):
-    """Wrapper around a scikit-learn classifier saved via joblib."""
+    def decode(self, proba: Sequence[float]) -> Tuple[Optional[str], float]:
+        """Map one row of class probabilities to ``(label, confidence)``."""
+        raise NotImplementedError
+
+    def decode_batch(self, proba_matrix: Any) -> Tuple[List[Optional[str]], List[float]]:
+        """Map every row of a probability matrix to labels and confidences."""
+        decoded = [self.decode(row) for row in proba_matrix]
+        return [label for label, _ in decoded], [confidence for _, confidence in decoded]
+
+    def predict_batch(self, feature_matrix: Any) -> Tuple[List[Optional[str]], List[float]]:
+        """Classify several feature rows with one ``predict_proba`` call."""
+        return self.decode_batch(self.predict_proba(feature_matrix))
+
+    def predict_proba_decisive(self, feature_matrix: Any, threshold: float):
+        """Probabilities precise enough to fix each row's argmax and whether it reaches ``threshold``.
+
+        Defaults to :meth:`predict_proba`; implementations may stop early once
+        both decisions can no longer change. The values themselves may then
+        differ from :meth:`predict_proba`, so the confidence decoded from them is
+        only guaranteed to fall on the same side of ``threshold``.
+        """
+        return self.predict_proba(feature_matrix)
+
+    def predict_labels(self, feature_matrix: Any) -> List[Optional[str]]:
+        """Only the most likely label per row, for callers that ignore confidences."""
+        return self.decode_batch(self.predict_proba(feature_matrix))[0]
+
+
+def onnx_sibling_paths(model_path: Path) -> Tuple[Path, Path]:
+    """``(<model>.onnx, <model>.int8.onnx)`` paths stored alongside a joblib model."""
+    return model_path.with_suffix(".onnx"), model_path.with_suffix(".int8.onnx")
+
+
+# Trees evaluated between early-exit checks when a forest runs through scikit-learn.
+EARLY_EXIT_CHUNK = 16
+
+# Estimators that are converted to ONNX on load when no export exists; ONNX
+# Runtime's tree kernels are much faster than scikit-learn's per-call overhead.
+TREE_ENSEMBLE_TYPES = frozenset({"RandomForestClassifier", "ExtraTreesClassifier"})
+
+
+def pack_forest(classifier: Any) -> Dict[str, Any]:
+    """Flatten a fitted forest into shared float32 node arrays (struct-of-arrays).
+
+    Every tree's nodes are concatenated into ``feature``/``threshold``/``left``/
+    ``right``/``value`` arrays, with ``roots`` holding each tree's first node.
+    Leaves point at themselves, so ``depth`` descent steps land every row on
+    its leaf. Thresholds are rounded down to float32, which keeps every
+    ``x <= threshold`` decision identical for float32 features; ``value`` holds
+    each node's class probabilities. Only plain arrays are stored, so the
+    result pickles without importing this module.
+    """
+    trees = [estimator.tree_ for estimator in classifier.estimators_]
+    roots = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+    feature, threshold, left, right, value = [], [], [], [], []
+    for root, tree in zip(roots.tolist(), trees):
+        nodes = np.arange(tree.node_count)
+        leaf = tree.children_left < 0
+        rounded = tree.threshold.astype(np.float32)
+        rounded = np.where(rounded > tree.threshold, np.nextafter(rounded, np.float32(-np.inf)), rounded)
+        feature.append(np.where(leaf, 0, tree.feature))
+        threshold.append(np.where(leaf, np.float32(np.inf), rounded))
+        left.append(np.where(leaf, nodes, tree.children_left) + root)
+        right.append(np.where(leaf, nodes, tree.children_right) + root)
+        counts = tree.value[:, 0, :]
+        value.append(counts / counts.sum(axis=1, keepdims=True))
+    return {
+        "feature": np.concatenate(feature).astype(np.int32),
+        "threshold": np.concatenate(threshold).astype(np.float32),
+        "left": np.concatenate(left).astype(np.int32),
+        "right": np.concatenate(right).astype(np.int32),
+        "value": np.concatenate(value).astype(np.float32),
+        "roots": roots.astype(np.int32),
+        "depth": max(tree.max_depth for tree in trees),
+    }
+
+
+def _packed_forest_kernel(prange: Any) -> Any:
+    """Per-row tree walk over :func:`pack_forest` arrays, looping rows with ``prange``."""
+
+    def kernel(feature, threshold, left, right, value, roots, batch, out):
+        for row in prange(batch.shape[0]):
+            for root in roots:
+                node = root
+                while left[node] != node:
+                    if batch[row, feature[node]] <= threshold[node]:
+                        node = left[node]
+                    else:
+                        node = right[node]
+                out[row, :] += value[node]
+            out[row, :] /= len(roots)
+
+    return kernel
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_packed_forest_kernel() -> Any:
+    """``_packed_forest_kernel`` compiled with numba over parallel rows, or ``None`` without numba."""
+    numba = _optional_module("numba")
+    if numba is None:
+        return None
+    return numba.njit(parallel=True, fastmath=True)(_packed_forest_kernel(numba.prange))
+
+
+def packed_forest_proba(packed: Mapping[str, Any], feature_matrix: Any) -> Any:
+    """Class probabilities from a :func:`pack_forest` model.
+
+    With numba each row walks its trees in a compiled loop (rows in parallel);
+    otherwise numpy descends every tree at once, one level per step.
+    """
+    batch = np.ascontiguousarray(feature_matrix, dtype=np.float32)
+    kernel = _jit_packed_forest_kernel()
+    if kernel is not None:
+        out = np.zeros((batch.shape[0], packed["value"].shape[1]), dtype=np.float32)
+        kernel(
+            packed["feature"], packed["threshold"], packed["left"], packed["right"],
+            packed["value"], packed["roots"], batch, out,
+        )
+        return out
+    rows = np.arange(batch.shape[0])[:, None]
+    feature, threshold = packed["feature"], packed["threshold"]
+    left, right = packed["left"], packed["right"]
+    node = np.broadcast_to(packed["roots"], (batch.shape[0], len(packed["roots"])))
+    for _ in range(packed["depth"]):
+        node = np.where(batch[rows, feature[node]] <= threshold[node], left[node], right[node])
+    return packed["value"][node].mean(axis=1)
+
+
+def sklearn_to_onnx(classifier: Any, feature_count: int) -> Any:
+    """Convert a fitted scikit-learn classifier to an ONNX ``ModelProto``.
+
+    The graph takes a float32 ``(N, feature_count)`` input and returns the class
+    probabilities as a plain ``(N, classes)`` tensor (no ZipMap), in
+    ``classifier.classes_`` order.
+    """
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+    except ImportError as exc:
+        # Only a missing package means "install it"; anything else is a broken install.
+        if exc.name == "skl2onnx":
+            raise ImportError(
+                "skl2onnx is required to convert gesture models to ONNX (pip install skl2onnx)"
+            ) from exc
+        raise ImportError(f"skl2onnx is installed but failed to import: {exc}") from exc
+
+    return convert_sklearn(
+        classifier,
+        initial_types=[("features", FloatTensorType([None, feature_count]))],
+        options={id(classifier): {"zipmap": False}},
+    )
 
-    def __init__(self, model_path: Path):
-        if joblib is None:
-            raise ImportError("joblib is required to load the gesture model")
+
+@functools.lru_cache(maxsize=4)
+def _load_model_payload(path: str, mtime_ns: int) -> Any:
+    """Unpickle a model payload once per file version.
+
+    Keyed by modification time so a retrained model is picked up. The payload
+    is shared by every classifier loaded from the same file and must be
+    treated as read-only.
+    """
+    joblib = _optional_module("joblib")
+    if joblib is None:
+        raise ImportError("joblib is required to load the gesture model")
+    return joblib.load(path)
+
+
+class MLGestureClassifier(BaseGestureClassifier):
+    """Wrapper around a scikit-learn classifier saved via joblib.
+
+    ``backend`` selects how probabilities are computed: ``"sklearn"`` always
+    uses the joblib estimator, ``"onnx"`` and ``"auto"`` use an up-to-date ONNX
+    export next to the joblib file (the int8 copy first) through onnxruntime
+    when it is installed. Tree ensembles without an export are converted on
+    load when skl2onnx is available, and the export is saved for next time.
+    ``"hummingbird"`` compiles the estimator to PyTorch tensor ops with
+    hummingbird-ml on load (opt-in, as it pulls in torch). Under ``"auto"``, a
+    forest without ONNX Runtime uses the float32 node arrays stored by
+    ``train_gesture_model.py --quantize`` (see :func:`pack_forest`) when present.
+    The joblib payload still supplies labels and metadata.
+    """
+
+    def __init__(self, model_path: Path, backend: str = "auto"):
         if not model_path.exists():
             raise FileNotFoundError(f"Gesture model not found at {model_path}")
 
-        payload = joblib.load(model_path)
+        payload = _load_model_payload(str(model_path), model_path.stat().st_mtime_ns)
         try:
             self._classifier = payload["classifier"]
             self._label_encoder = payload["label_encoder"]
@@ -256,55 +619,307 @@ class MLGestureClassifier(BaseGestureClassifier):
             raise ValueError("Invalid gesture model payload") from exc
 
         self.model_path: Path = model_path
+        packed_forest = payload.get("packed_forest") if isinstance(payload, dict) else None
         self.metadata: Dict[str, Any] = payload.get("metadata", {}) if isinstance(payload, dict) else {}
+        # Decode every class once so predictions never call the label encoder per frame.
+        self.class_labels = [
+            str(label) for label in self._label_encoder.inverse_transform(self._classifier.classes_)
+        ]
+        self._n_classes = len(self.class_labels)
+        self._class_to_label: Dict[Any, str] = dict(zip(self._classifier.classes_.tolist(), self.class_labels))
+
+        feature_count = len(self.feature_names) if self.feature_names else None
+        self._feature_row = (
+            np.empty((1, feature_count), dtype=np.float32) if np is not None and feature_count else None
+        )
+
+        # Forests left on scikit-learn may skip their remaining trees once a frame is decided.
+        self._early_exit = (
+            np is not None
+            and type(self._classifier).__name__ in TREE_ENSEMBLE_TYPES
+            and self._n_classes > 1
+            and bool(self.metadata.get("early_exit", True))
+        )
+
+        self.backend = "sklearn"
+        self._onnx_session: Any = None
+        self._onnx_input: Optional[str] = None
+        self._onnx_output: Optional[str] = None
+        self._onnx_label_output: Optional[str] = None
+        self._compiled_model: Any = None
+        self._packed_forest: Optional[Dict[str, Any]] = None
+        if backend not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown gesture model backend '{backend}' (expected one of {MODEL_BACKENDS})")
+        if backend == "hummingbird":
+            self._load_hummingbird()
+        elif backend != "sklearn":
+            self._load_onnx(model_path, required=backend == "onnx")
+        if self.backend == "sklearn" and backend == "auto" and packed_forest is not None and np is not None:
+            self._packed_forest = packed_forest
+            self.backend = "packed"
 
         if np is None:
             logger.warning("numpy not available – falling back to Python lists for predictions")
 
+    def _load_onnx(self, model_path: Path, required: bool) -> None:
+        onnx_path, int8_path = onnx_sibling_paths(model_path)
+        model_mtime = model_path.stat().st_mtime
+        # An export older than the joblib file belongs to a previous training run.
+        candidates = [
+            path for path in (int8_path, onnx_path) if path.exists() and path.stat().st_mtime >= model_mtime
+        ]
+        convertible = type(self._classifier).__name__ in TREE_ENSEMBLE_TYPES
+        ort = _optional_module("onnxruntime") if candidates or convertible else None
+        source: Union[str, bytes, None] = str(candidates[0]) if candidates else None
+        if source is None and convertible and ort is not None and np is not None:
+            source = self._convert_to_onnx(onnx_path)
+        if ort is None or np is None or source is None:
+            if required:
+                if ort is None and (candidates or convertible):
+                    reason = "onnxruntime is not installed"
+                elif convertible:
+                    reason = "it could not be converted (is skl2onnx installed?)"
+                else:
+                    reason = "no up-to-date .onnx export exists"
+                logger.warning("ONNX backend requested for %s but %s; using scikit-learn.", model_path.name, reason)
+            return
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        try:
+            session = ort.InferenceSession(source, sess_options=options, providers=["CPUExecutionProvider"])
+        except Exception as exc:
+            # A truncated or otherwise unreadable export must not break loading the model.
+            logger.warning(
+                "Could not load ONNX export for %s (%s); using scikit-learn.", model_path.name, exc
+            )
+            return
+        outputs = session.get_outputs()
+        # skl2onnx classifiers emit (label, probabilities); take the probability tensor.
+        self._onnx_output = outputs[-1].name
+        self._onnx_label_output = outputs[0].name
+        self._onnx_input = session.get_inputs()[0].name
+        self._onnx_session = session
+        self.backend = "onnx"
+        logger.info("Using ONNX Runtime for gesture model %s", (candidates[0] if candidates else onnx_path).name)
+
+    def _load_hummingbird(self) -> None:
+        hummingbird_ml = _optional_module("hummingbird.ml")
+        torch = _optional_module("torch")
+        if hummingbird_ml is None or torch is None or np is None:
+            logger.warning(
+                "Hummingbird backend requested for %s but hummingbird-ml/torch are not installed; "
+                "using scikit-learn.",
+                self.model_path.name,
+            )
+            return
+        try:
+            compiled = hummingbird_ml.convert(self._classifier, "torch")
+        except Exception as exc:  # pragma: no cover - unsupported estimators fall back
+            logger.warning("Could not compile %s with hummingbird: %s", self.model_path.name, exc)
+            return
+        # Frames are classified one or two rows at a time, where extra threads only add overhead.
+        # Note that this limit is process-wide.
+        torch.set_num_threads(1)
+        self._compiled_model = compiled
+        self.backend = "hummingbird"
+        logger.info("Using hummingbird (torch) for gesture model %s", self.model_path.name)
+
+    def _convert_to_onnx(self, onnx_path: Path) -> Optional[bytes]:
+        """Convert the estimator to ONNX, saving it next to the model when possible."""
+        feature_count = len(self.feature_names) if self.feature_names else int(self._classifier.n_features_in_)
+        try:
+            serialized = sklearn_to_onnx(self._classifier, feature_count).SerializeToString()
+        except ImportError:
+            return None
+        except Exception as exc:  # pragma: no cover - converter gaps are not fatal
+            logger.warning("Could not convert %s to ONNX: %s", self.model_path.name, exc)
+            return None
+        # Write through a temporary file so a concurrent loader never sees a partial export.
+        tmp_name: Optional[str] = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{onnx_path.name}.", suffix=".tmp", dir=onnx_path.parent)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(serialized)
+            os.replace(tmp_name, onnx_path)
+        except OSError as exc:
+            logger.debug("Could not cache ONNX export at %s: %s", onnx_path, exc)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+        return serialized
+
     def predict(self, features: Sequence[float]) -> Tuple[Optional[str], float]:
-        if not features:
+        if not len(features):
             return None, 0.0
-        proba = self._classifier.predict_proba([features])[0]
-        proba_values = proba.tolist() if hasattr(proba, "tolist") else list(proba)
-        if not proba_values:
+        if np is None:
+            return self.decode(self.predict_proba([features])[0])
+        # Single-sample predictions reuse one (1, n_features) row.
+        row = self._feature_row
+        if row is None or row.shape[1] != len(features):
+            row = self._feature_row = np.empty((1, len(features)), dtype=np.float32)
+        row[0, :] = features
+        return self.decode(self.predict_proba(row)[0])
+
+    def decode(self, proba: Sequence[float]) -> Tuple[Optional[str], float]:
+        if not len(proba):
             return None, 0.0
-        best_index = max(range(len(proba_values)), key=lambda idx: proba_values[idx])
-        encoded_class = self._classifier.classes_[best_index]
-        label = self._label_encoder.inverse_transform([encoded_class])[0]
-        return str(label), float(proba_values[best_index])
+        if np is None:
+            best_index = max(range(len(proba)), key=lambda idx: proba[idx])
+        else:
+            best_index = int(np.argmax(proba))
+        return self.class_labels[best_index], float(proba[best_index])
+
+    def decode_batch(self, proba_matrix: Any) -> Tuple[List[Optional[str]], List[float]]:
+        if np is None or not len(proba_matrix):
+            return super().decode_batch(proba_matrix)
+        proba_matrix = np.asarray(proba_matrix)
+        best = proba_matrix.argmax(axis=1)
+        confidences = proba_matrix[np.arange(len(best)), best]
+        return [self.class_labels[idx] for idx in best.tolist()], confidences.tolist()
 
     def predict_proba(self, feature_matrix: Sequence[Sequence[float]]):
+        if self._onnx_session is not None:
+            batch = np.asarray(feature_matrix, dtype=np.float32)
+            return self._onnx_session.run([self._onnx_output], {self._onnx_input: batch})[0]
+        if self._compiled_model is not None:
+            return self._compiled_model.predict_proba(np.asarray(feature_matrix, dtype=np.float32))
+        if self._packed_forest is not None:
+            return packed_forest_proba(self._packed_forest, feature_matrix)
         return self._classifier.predict_proba(feature_matrix)
 
+    def predict_labels(self, feature_matrix: Any) -> List[Optional[str]]:
+        if self._onnx_session is not None:
+            batch = np.asarray(feature_matrix, dtype=np.float32)
+            encoded = self._onnx_session.run([self._onnx_label_output], {self._onnx_input: batch})[0]
+        elif self._compiled_model is not None:
+            encoded = self._compiled_model.predict(np.asarray(feature_matrix, dtype=np.float32))
+        elif self._packed_forest is not None:
+            return self.decode_batch(self.predict_proba(feature_matrix))[0]
+        elif self._early_exit:
+            # With no threshold to meet, trees stop as soon as the argmax is fixed.
+            return self.decode_batch(self._forest_proba_early_exit(feature_matrix, 0.0))[0]
+        else:
+            encoded = self._classifier.predict(feature_matrix)
+        return [self._class_to_label[value] for value in encoded.tolist()]
+
+    def predict_proba_decisive(self, feature_matrix: Any, threshold: float):
+        if self.backend != "sklearn" or not self._early_exit:
+            return self.predict_proba(feature_matrix)
+        return self._forest_proba_early_exit(feature_matrix, threshold)
+
+    def _forest_proba_early_exit(self, feature_matrix: Any, threshold: float):
+        """Average tree probabilities chunk by chunk, stopping once every row is decided.
+
+        Each tree adds at most 1 to a class total, so after ``used`` trees a row is
+        settled when its leader cannot reach ``threshold`` even with every
+        remaining vote, or when it already has and the runner-up cannot catch up.
+
+        The returned averages cover only the trees evaluated so far, so they are
+        not the full forest's probabilities. Whether a row reaches ``threshold``
+        is always the same as for the full forest, and so is the argmax of every
+        row that does (and of every row when ``threshold`` is 0). The reported
+        confidence of such a row can differ from :meth:`predict_proba` but stays
+        at or above ``threshold``; rows below it may report a different argmax,
+        which the recognizer discards anyway.
+        """
+        batch = np.ascontiguousarray(feature_matrix, dtype=np.float32)
+        trees = self._classifier.estimators_
+        tree_count = len(trees)
+        target = threshold * tree_count
+        totals = np.zeros((batch.shape[0], self._n_classes), dtype=np.float64)
+        used = 0
+        while used < tree_count:
+            for tree in trees[used : used + EARLY_EXIT_CHUNK]:
+                totals += tree.predict_proba(batch, check_input=False)
+            used = min(used + EARLY_EXIT_CHUNK, tree_count)
+            remaining = tree_count - used
+            runner_up, leader = np.partition(totals, -2, axis=1)[:, -2:].T
+            below = leader + remaining < target
+            locked = (leader >= target) & (leader - runner_up > remaining)
+            if np.all(below | locked):
+                break
+        return totals / used
+
     @property
     def classes_(self):
         return self._classifier.classes_
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_model_alias(models_dir: str, alias: str, dir_mtime_ns: int) -> Optional[Path]:
+    """Newest ``*.joblib`` in ``models_dir`` whose name contains ``alias``.
+
+    ``dir_mtime_ns`` keys the cache so adding or removing models rescans the directory.
+    """
+    try:
+        ranked = sorted(
+            (p for p in Path(models_dir).glob("*.joblib") if alias in p.stem.lower()),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+    except OSError:
+        return None
+    if ranked:
+        return ranked[0].resolve()
+    return None
+
+
 def _resolve_model_reference(reference: Union[str, Path]) -> Optional[Path]:
     candidate = Path(reference)
     if not candidate.suffix:
         models_dir = _default_project_root() / "models"
-        if not models_dir.exists():
-            return None
-        alias = str(reference).lower()
         try:
-            ranked = sorted(
-                (p for p in models_dir.glob("*.joblib") if alias in p.stem.lower()),
-                key=lambda path: path.stat().st_mtime,
-                reverse=True,
-            )
+            dir_mtime_ns = models_dir.stat().st_mtime_ns
         except OSError:
             return None
-        if ranked:
-            return ranked[0].resolve()
-        return None
+        resolved = _resolve_model_alias(str(models_dir), str(reference).lower(), dir_mtime_ns)
+        return resolved if resolved is not None and resolved.exists() else None
 
     if not candidate.is_absolute():
         candidate = (_default_project_root() / candidate).resolve()
     return candidate if candidate.exists() else None
 
 
+def _ring_update(labels, scores, index, label_id, score, counts, score_sums):
+    """Store ``(label_id, score)`` in ring slot ``index`` and update the per-label tallies.
+
+    ``label_id`` is -1 for "no prediction". Returns ``(best_id, count, mean_score)``
+    for the most frequent label in the window, or ``(-1, 0, 0.0)`` when it is empty.
+    """
+    evicted = labels[index]
+    if evicted >= 0:
+        counts[evicted] -= 1
+        if counts[evicted] == 0:
+            score_sums[evicted] = 0.0
+        else:
+            score_sums[evicted] -= scores[index]
+    labels[index] = label_id
+    scores[index] = score
+    if label_id >= 0:
+        counts[label_id] += 1
+        score_sums[label_id] += score
+
+    best_id = -1
+    best_count = 0
+    for idx in range(len(counts)):
+        if counts[idx] > best_count:
+            best_id = idx
+            best_count = counts[idx]
+    if best_id < 0:
+        return -1, 0, 0.0
+    return best_id, best_count, score_sums[best_id] / best_count
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_ring_update() -> Any:
+    """``_ring_update`` compiled with numba, or the Python function when numba is not installed."""
+    numba = _optional_module("numba")
+    return numba.njit(_ring_update) if numba is not None else _ring_update
+
+
 class GestureRecognizer:
     """High-level gesture recognizer that wraps classification + gesture actions."""
 
@@ -341,8 +956,10 @@ class GestureRecognizer:
         self._max_history: int = max(int(model_cfg.get("max_history", self._smoothing_window * 3)), self._smoothing_window)
 
         self._feature_extractor = GestureFeatureExtractor()
-        self._hand_history: Dict[str, Deque[Optional[str]]] = {}
-        self._hand_scores: Dict[str, Deque[float]] = {}
+        self._last_proba: Dict[str, Any] = {}
+        self._landmark_buffer = np.empty((21, 3), dtype=np.float32) if np is not None else None
+        # One row per hand, grown if more hands show up; 21 landmarks x 3 + hand flag.
+        self._feature_buffer = np.empty((2, 21 * 3 + 1), dtype=np.float32) if np is not None else None
         self._warned_missing_model = False
 
         model_path = Path(model_cfg.get("path", "models/gesture_classifier.joblib"))
@@ -351,7 +968,7 @@ class GestureRecognizer:
 
         classifier: Optional[BaseGestureClassifier]
         try:
-            classifier = MLGestureClassifier(model_path)
+            classifier = MLGestureClassifier(model_path, backend=str(model_cfg.get("backend", "auto")))
         except (ImportError, FileNotFoundError) as exc:
             classifier = None
             logger.warning(
@@ -363,6 +980,10 @@ class GestureRecognizer:
             logger.error("Failed to load gesture classifier: %s", exc)
 
         self._classifier = classifier
+        # Smoothing tracks predictions by class index.
+        self._class_labels: List[str] = list(classifier.class_labels) if classifier else []
+        self._class_ids: Dict[str, int] = {label: idx for idx, label in enumerate(self._class_labels)}
+        self._allocate_history()
         self._label_encoder = getattr(classifier, "_label_encoder", None) if classifier else None
         self._model_metadata: Dict[str, Any] = getattr(classifier, "metadata", {}) if classifier else {}
         self._model_path: Optional[Path] = getattr(classifier, "model_path", model_path)
@@ -420,9 +1041,18 @@ class GestureRecognizer:
     def model_path(self) -> Optional[Path]:
         return self._model_path
 
+    def get_last_proba(self, hand_label: str) -> Optional[Any]:
+        """Class probabilities computed for ``hand_label`` by the latest :meth:`process` call.
+
+        Columns follow ``classifier.classes_``; ``None`` when that hand was not classified.
+        Forests evaluated with early exit report the average over the trees they used.
+        Not recorded when ``probability_threshold`` is 0, as only labels are predicted then.
+        """
+        return self._last_proba.get(hand_label)
+
     def reset(self) -> None:
-        self._hand_history.clear()
-        self._hand_scores.clear()
+        self._allocate_history()
+        self._last_proba.clear()
         self._action_manager.reset()
 
     def process(
@@ -431,84 +1061,138 @@ class GestureRecognizer:
         handedness_list: Optional[Sequence[object]],
     ) -> Tuple[List[GestureEvent], List[str]]:
         overlays: List[str] = []
+        self._last_proba.clear()
 
         if self._classifier is None:
             if not self._warned_missing_model:
                 overlays.append("Gesture model not loaded. Run training to enable gestures.")
                 self._warned_missing_model = True
-            events = self._action_manager.update({})
+            events = self._action_manager.update(_NO_HANDS)
             if events:
                 overlays.append("Clearing active gesture events")
             return events, overlays
 
         if not hand_landmarks or not handedness_list:
-            events = self._action_manager.update({})
+            events = self._action_manager.update(_NO_HANDS)
             if events:
                 overlays.append("Gestures cleared")
             return events, overlays
 
-        predictions: Dict[str, HandPrediction] = {}
+        slots: List[Optional[HandPrediction]] = [None, None]
 
+        # Features for every hand are written into consecutive rows of one reused
+        # matrix, which is then classified with a single predict_proba call.
+        buffer = self._feature_buffer
+        if buffer is not None and buffer.shape[0] < len(hand_landmarks):
+            buffer = self._feature_buffer = np.empty(
+                (len(hand_landmarks), buffer.shape[1]), dtype=np.float32
+            )
+        hands: List[Tuple[str, str, Optional[Any]]] = []
+        feature_rows: List[Any] = []
         for landmarks, handedness in zip(hand_landmarks, handedness_list):
             try:
                 label = handedness.classification[0].label  # type: ignore[attr-defined]
             except (IndexError, AttributeError):
                 continue
-            if hasattr(landmarks, "landmark"):
-                landmarks_seq = list(getattr(landmarks, "landmark"))
-            elif isinstance(landmarks, Sequence):
-                landmarks_seq = list(landmarks)
+            out = buffer[len(feature_rows)] if buffer is not None else None
+            features = self._extract_features(landmarks, handedness_flag(label), out)
+            if features is not None:
+                feature_rows.append(features)
+            hands.append((label, label.capitalize(), features))
+
+        decoded: Iterable[Tuple[Any, Optional[str], float]] = iter(())
+        if feature_rows:
+            batch = buffer[: len(feature_rows)] if buffer is not None else feature_rows
+            if self._probability_threshold <= 0:
+                # Every label is accepted, so only the argmax is needed; confidence is reported as 1.
+                batch_labels = self._classifier.predict_labels(batch)
+                decoded = ((None, batch_label, 1.0) for batch_label in batch_labels)
             else:
-                landmarks_seq = []
+                proba_matrix = self._classifier.predict_proba_decisive(batch, self._probability_threshold)
+                batch_labels, batch_confidences = self._classifier.decode_batch(proba_matrix)
+                decoded = zip(proba_matrix, batch_labels, batch_confidences)
 
-            features = self._feature_extractor.extract(landmarks_seq, label)
+        for label, display_label, features in hands:
             predicted_label: Optional[str]
             confidence: float
             if features is None:
                 predicted_label = None
                 confidence = 0.0
             else:
-                raw_label, raw_confidence = self._classifier.predict(features)
+                proba, raw_label, raw_confidence = next(decoded)
+                if proba is not None:
+                    self._last_proba[label] = proba
                 if raw_label is None or raw_confidence < self._probability_threshold:
                     predicted_label = None
                     confidence = raw_confidence
                 else:
                     predicted_label, confidence = raw_label, raw_confidence
 
+            slot = HAND_SLOTS.index(display_label) if display_label in HAND_SLOTS else -1
             smoothed_label, smoothed_confidence = self._update_hand_history(
-                label, predicted_label, confidence
-            )
-            predictions[label.capitalize()] = HandPrediction(smoothed_label, smoothed_confidence)
-            overlays.append(
-                f"{label.capitalize()}: {(smoothed_label or '—')} ({smoothed_confidence:0.2f})"
+                slot, predicted_label, confidence
             )
+            if slot >= 0:
+                slots[slot] = HandPrediction(smoothed_label, smoothed_confidence)
+            overlays.append(f"{display_label}: {(smoothed_label or '—')} ({smoothed_confidence:0.2f})")
 
-        events = self._action_manager.update(predictions)
+        events = self._action_manager.update(HandPredictions(*slots))
         return events, overlays
 
+    def _extract_features(
+        self, landmarks: object, hand_flag: float, out: Optional[Any] = None
+    ) -> Optional[Any]:
+        # Copy the landmarks straight into a reused array instead of building a list of
+        # protobuf proxies; fall back to the object path for unusual inputs.
+        if np is not None and (hasattr(landmarks, "landmark") or isinstance(landmarks, Sequence)):
+            points = landmarks_to_array(landmarks, out=self._landmark_buffer)
+            if points is not None:
+                return self._feature_extractor.extract(points, hand_flag, out)
+        # MediaPipe's repeated landmark field already supports len() and iteration.
+        landmarks_seq = getattr(landmarks, "landmark", landmarks)
+        if not hasattr(landmarks_seq, "__len__"):
+            return None
+        return self._feature_extractor.extract(landmarks_seq, hand_flag, out)
+
+    def _allocate_history(self) -> None:
+        """(Re)create the smoothing state: one row per hand slot in a few shared arrays.
+
+        Labels are stored as class indices; per-label counts and confidence sums are
+        kept alongside and adjusted as entries are evicted from the ring.
+        """
+        shape = (len(HAND_SLOTS), self._smoothing_window)
+        tally_shape = (len(HAND_SLOTS), len(self._class_labels))
+        if np is not None:
+            self._history_labels = np.full(shape, -1, dtype=np.int64)
+            self._history_scores = np.zeros(shape, dtype=np.float64)
+            self._history_counts = np.zeros(tally_shape, dtype=np.int64)
+            self._history_sums = np.zeros(tally_shape, dtype=np.float64)
+        else:
+            self._history_labels = [[-1] * shape[1] for _ in HAND_SLOTS]
+            self._history_scores = [[0.0] * shape[1] for _ in HAND_SLOTS]
+            self._history_counts = [[0] * tally_shape[1] for _ in HAND_SLOTS]
+            self._history_sums = [[0.0] * tally_shape[1] for _ in HAND_SLOTS]
+        self._history_index = [0] * len(HAND_SLOTS)
+
     def _update_hand_history(
-        self, hand_label: str, predicted_label: Optional[str], confidence: float
+        self, slot: int, predicted_label: Optional[str], confidence: float
     ) -> Tuple[Optional[str], float]:
-        history = self._hand_history.setdefault(
-            hand_label, deque(maxlen=self._max_history)
-        )
-        scores = self._hand_scores.setdefault(hand_label, deque(maxlen=self._max_history))
-        history.append(predicted_label)
-        scores.append(confidence)
-
-        if self._smoothing_window <= 1:
+        # Hands outside HAND_SLOTS have no history row and pass through unsmoothed.
+        if self._smoothing_window <= 1 or slot < 0:
             return predicted_label, confidence
 
-        recent_labels = list(history)[-self._smoothing_window :]
-        recent_scores = list(scores)[-self._smoothing_window :]
-        counts = Counter(lbl for lbl in recent_labels if lbl)
-        if not counts:
-            return None, 0.0
-        best_label, best_count = counts.most_common(1)[0]
-        if best_count < self._min_consensus:
+        label_id = -1 if predicted_label is None else self._class_ids.get(predicted_label, -1)
+        index = self._history_index[slot]
+        best_id, best_count, mean_score = _jit_ring_update()(
+            self._history_labels[slot],
+            self._history_scores[slot],
+            index,
+            label_id,
+            float(confidence),
+            self._history_counts[slot],
+            self._history_sums[slot],
+        )
+        self._history_index[slot] = (index + 1) % self._smoothing_window
+        if best_id < 0 or best_count < self._min_consensus:
             return None, 0.0
-        relevant_scores = [
-            score for lbl, score in zip(recent_labels, recent_scores) if lbl == best_label
-        ]
-        avg_score = sum(relevant_scores) / len(relevant_scores) if relevant_scores else 0.0
-        return best_label, avg_score
+        return self._class_labels[best_id], float(mean_score)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+import joblib
+
+PROJECT_ROOT = Path(__file__).resolve().parents[0]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from gesture_recognizer import onnx_sibling_paths, sklearn_to_onnx  # noqa: E402
+
+
+# Operators that dynamic int8 quantization rewrites; graphs without them are skipped.
+QUANTIZABLE_OPS = frozenset({"MatMul", "Gemm"})
+
+
+def export_onnx(
+    classifier: Any,
+    feature_count: int,
+    output_path: Path,
+    quantize: bool = False,
+) -> Path:
+    """Write ``classifier`` as ONNX (see :func:`sklearn_to_onnx`) to ``output_path``.
+
+    With ``quantize`` an additional int8 dynamically-quantized copy is written
+    for models built from matrix multiplies (logistic regression, MLP); tree
+    ensembles have nothing to quantize and are left as float32.
+
+    Returns the path of the model the recognizer will prefer.
+    """
+    return write_onnx(sklearn_to_onnx(classifier, feature_count), output_path, quantize=quantize)
+
+
+def write_onnx(onnx_model: Any, output_path: Path, quantize: bool = False) -> Path:
+    """Save an already converted model; ``quantize`` behaves as in :func:`export_onnx`."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(onnx_model.SerializeToString())
+    if not quantize or not any(node.op_type in QUANTIZABLE_OPS for node in onnx_model.graph.node):
+        return output_path
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        if exc.name == "onnxruntime":
+            raise ImportError(
+                "onnxruntime is required to quantize gesture models (pip install onnxruntime)"
+            ) from exc
+        raise ImportError(f"onnxruntime is installed but failed to import: {exc}") from exc
+
+    quantized_path = output_path.with_suffix(".int8.onnx")
+    quantize_dynamic(str(output_path), str(quantized_path), weight_type=QuantType.QInt8)
+    return quantized_path
+
+
+def export_model_file(model_path: Path, quantize: bool = False) -> Path:
+    """Export the classifier stored in a gesture model joblib payload."""
+    payload = joblib.load(model_path)
+    classifier = payload["classifier"]
+    feature_names: Optional[List[str]] = payload.get("feature_names")
+    feature_count = len(feature_names) if feature_names else int(classifier.n_features_in_)
+    onnx_path, _ = onnx_sibling_paths(model_path)
+    return export_onnx(classifier, feature_count, onnx_path, quantize=quantize)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Export trained gesture models to ONNX so the recognizer can run them with onnxruntime."
+        )
+    )
+    parser.add_argument(
+        "models",
+        nargs="+",
+        type=Path,
+        help="Gesture model .joblib files to export; the .onnx file is written alongside each one.",
+    )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Also write an int8 dynamically-quantized copy (<model>.int8.onnx).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    for model_path in args.models:
+        exported = export_model_file(model_path.resolve(), quantize=args.quantize)
+        print(f"Exported {model_path} -> {exported}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# (text, font scale, BGR colour)
+TextLine = Tuple[str, float, Tuple[int, int, int]]
+
+
+class OverlayStrip:
+    """Caches rasterized text lines so ``cv2.putText`` only runs when they change.
+
+    The lines are rendered once onto a small strip together with a mask of the
+    glyph pixels; every later frame with the same lines just copies those
+    pixels over the top of the frame.
+    """
+
+    def __init__(self, baseline: int = 20, line_height: int = 20, left: int = 10):
+        self._baseline = baseline
+        self._line_height = line_height
+        self._left = left
+        self._key: Optional[Tuple[object, ...]] = None
+        self._strip: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+    def height_for(self, line_count: int) -> int:
+        """Height of a strip holding ``line_count`` lines (room for descenders included)."""
+        return self._baseline + max(line_count - 1, 0) * self._line_height + 10
+
+    def _render(self, lines: Sequence[TextLine], width: int) -> None:
+        strip = np.zeros((self.height_for(len(lines)), width, 3), dtype=np.uint8)
+        for idx, (text, scale, color) in enumerate(lines):
+            cv2.putText(
+                strip,
+                text,
+                (self._left, self._baseline + idx * self._line_height),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                scale,
+                color,
+                1,
+                cv2.LINE_AA,
+            )
+        self._strip = strip
+        self._mask = strip.any(axis=2, keepdims=True)
+
+    def draw(self, frame: np.ndarray, lines: Tuple[TextLine, ...]) -> None:
+        key = (lines, frame.shape[1])
+        if key != self._key:
+            self._render(lines, frame.shape[1])
+            self._key = key
+        height = min(self._strip.shape[0], frame.shape[0])
+        np.copyto(frame[:height], self._strip[:height], where=self._mask[:height])
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 TRAIN_SCRIPT = SCRIPT_DIR / "train_gesture_model.py"
@@ -13,6 +15,7 @@ DEFAULT_OUTPUT_DIR = SCRIPT_DIR / "models"
 DEFAULT_CONFIG = SCRIPT_DIR / "gestures.yml"
 
 MODEL_TYPES: List[str] = [
+    "hist_gbdt",
     "random_forest",
     "extra_trees",
     "sgd",
@@ -21,6 +24,17 @@ MODEL_TYPES: List[str] = [
     "naive_bayes",
 ]
 
+# Parallel jobs each get a single BLAS/OpenMP thread so they do not oversubscribe the CPU.
+SINGLE_THREAD_ENV = {
+    "OMP_NUM_THREADS": "1",
+    "OPENBLAS_NUM_THREADS": "1",
+    "MKL_NUM_THREADS": "1",
+}
+
+# Models that --quantize applies to: matrix-multiply models get an int8 ONNX copy,
+# forests float32 node arrays.
+QUANTIZED_MODEL_TYPES = frozenset({"logistic", "mlp", "random_forest", "extra_trees"})
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -86,6 +100,20 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Overwrite existing output files instead of generating unique names.",
     )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help=(
+            "Export logistic/mlp models to ONNX with an int8 quantized copy after training "
+            "(requires skl2onnx and onnxruntime) and store float32 node arrays for forests."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of models to train concurrently (default: 1, one after another).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -130,6 +158,8 @@ def build_command(
         cmd.extend(["--seed", str(args.seed)])
     if args.force:
         cmd.append("--force")
+    if args.quantize and model_type in QUANTIZED_MODEL_TYPES:
+        cmd.append("--quantize")
 
     return cmd
 
@@ -142,12 +172,20 @@ def run_training_sequence(models: Iterable[str], args: argparse.Namespace) -> No
 
     base_name = args.base_name or dataset.stem
 
+    tasks: List[Tuple[str, Path, List[str]]] = []
     for model_type in models:
         output_filename = f"{base_name}-{model_type}.joblib"
         output_path = output_dir / output_filename
         cmd = build_command(model_type, dataset, output_path, config_path, args)
         if args.verbose:
             print("Running:", " ".join(cmd))
+        tasks.append((model_type, output_path, cmd))
+
+    if args.jobs > 1 and len(tasks) > 1:
+        run_parallel(tasks, args.jobs)
+        return
+
+    for model_type, output_path, cmd in tasks:
         print(f"\n=== Training {model_type} => {output_path} ===")
         result = subprocess.run(cmd, check=False)
         if result.returncode != 0:
@@ -155,6 +193,37 @@ def run_training_sequence(models: Iterable[str], args: argparse.Namespace) -> No
             raise SystemExit(result.returncode)
 
 
+def run_parallel(tasks: List[Tuple[str, Path, List[str]]], jobs: int) -> None:
+    """Train several models at once, printing each one's output as it finishes."""
+    env = {**os.environ, **SINGLE_THREAD_ENV}
+    failures: Dict[str, int] = {}
+    with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = {
+            executor.submit(
+                subprocess.run,
+                cmd,
+                check=False,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            ): (model_type, output_path)
+            for model_type, output_path, cmd in tasks
+        }
+        for future in as_completed(futures):
+            model_type, output_path = futures[future]
+            result = future.result()
+            print(f"\n=== Training {model_type} => {output_path} ===")
+            print(result.stdout, end="")
+            if result.returncode != 0:
+                print(f"Command failed for model {model_type} (exit code {result.returncode}).")
+                failures[model_type] = result.returncode
+
+    if failures:
+        print(f"Training failed for: {', '.join(sorted(failures))}")
+        raise SystemExit(next(iter(failures.values())))
+
+
 def main() -> None:
     args = parse_args()
     run_training_sequence(args.models, args)
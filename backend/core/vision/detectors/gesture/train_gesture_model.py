@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
+import os
 import sys
-from datetime import datetime
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,19 +19,53 @@ try:  # pandas is required for training but may not be installed yet
 except ImportError as exc:  # pragma: no cover - runtime check
     raise ImportError("pandas is required to train the gesture model. Install it via requirements.txt.") from exc
 
-from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
-from sklearn.linear_model import LogisticRegression, SGDClassifier
+# Forests and LogisticRegression are looked up on their modules when built, so
+# --intelex patching (which replaces those module attributes) takes effect.
+from sklearn import ensemble, linear_model
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import classification_report
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
 from sklearn.naive_bayes import GaussianNB
 from sklearn.neural_network import MLPClassifier
-from sklearn.preprocessing import LabelEncoder
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.utils.class_weight import compute_sample_weight
 
 PROJECT_ROOT = Path(__file__).resolve().parents[0]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from gesture_recognizer import load_gesture_config  # noqa: E402
+from gesture_recognizer import (  # noqa: E402
+    GestureFeatureExtractor,
+    load_gesture_config,
+    onnx_sibling_paths,
+    pack_forest,
+    packed_forest_proba,
+    raw_landmark_columns,
+    sklearn_to_onnx,
+)
+from onnx_export import write_onnx  # noqa: E402
+
+
+FOREST_MODEL_TYPES = frozenset({"random_forest", "extra_trees"})
+# Gradient-based models trained behind a StandardScaler.
+SCALED_MODEL_TYPES = frozenset({"logistic", "mlp"})
+# Models fitted on the float32 feature matrix as-is.
+FLOAT32_MODEL_TYPES = FOREST_MODEL_TYPES | {"hist_gbdt"}
+
+
+MODEL_PICKLE_PROTOCOL = 5
+
+
+def _model_compression() -> Tuple[str, int]:
+    """joblib ``compress`` setting for saved models: lz4 when installed, else zlib.
+
+    Compressed payloads are much smaller for forests and decompress quickly; note
+    that joblib cannot memory-map (``mmap_mode``) a compressed file.
+    """
+    codec = "lz4" if importlib.util.find_spec("lz4") is not None else "zlib"
+    return codec, 3
 
 
 def parse_args() -> argparse.Namespace:
@@ -55,7 +94,7 @@ def parse_args() -> argparse.Namespace:
         "--trees",
         type=int,
         default=250,
-        help="Number of trees in the random forest classifier",
+        help="Number of trees (random_forest/extra_trees) or boosting iterations (hist_gbdt)",
     )
     parser.add_argument(
         "--max-depth",
@@ -78,6 +117,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--model-type",
         choices=[
+            "hist_gbdt",
             "random_forest",
             "extra_trees",
             "sgd",
@@ -85,8 +125,11 @@ def parse_args() -> argparse.Namespace:
             "mlp",
             "naive_bayes",
         ],
-        default="random_forest",
-        help="Classifier to train. Defaults to random_forest for parity with the existing model.",
+        default="hist_gbdt",
+        help=(
+            "Classifier to train. Defaults to hist_gbdt (histogram gradient boosting), which "
+            "fits much faster than the forests and produces a smaller, quicker model."
+        ),
     )
     parser.add_argument(
         "--tag",
@@ -99,9 +142,38 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Overwrite the output file if it already exists instead of creating a unique name.",
     )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help=(
+            "Also write an int8 dynamically-quantized copy of the ONNX export "
+            "(requires skl2onnx and onnxruntime). The recognizer prefers the int8 model. "
+            "Forests additionally store float32 node arrays in the payload, used when "
+            "onnxruntime is not installed."
+        ),
+    )
+    parser.add_argument(
+        "--intelex",
+        action="store_true",
+        help=(
+            "Train through Intel's scikit-learn-intelex (oneDAL) kernels where it has them "
+            "(forests, logistic regression). The saved model then needs scikit-learn-intelex "
+            "installed wherever it is loaded."
+        ),
+    )
     return parser.parse_args()
 
 
+def patch_intelex() -> bool:
+    """Route supported scikit-learn estimators to scikit-learn-intelex; False if not installed."""
+    try:
+        from sklearnex import patch_sklearn  # type: ignore[import]
+    except ImportError:
+        return False
+    patch_sklearn()
+    return True
+
+
 def ensure_unique_output_path(
     base_path: Path,
     model_type: str,
@@ -112,41 +184,49 @@ def ensure_unique_output_path(
     if force or not base_path.exists():
         return base_path
 
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     suffix_parts = [model_type, timestamp]
     if tag:
         suffix_parts.insert(1, tag)
 
-    candidate = base_path.with_name(
-        f"{base_path.stem}_{'_'.join(suffix_parts)}{base_path.suffix}"
-    )
+    # List the directory once rather than stat-ing every numbered candidate.
+    stem = f"{base_path.stem}_{'_'.join(suffix_parts)}"
+    existing = {entry.name for entry in os.scandir(base_path.parent)}
+    name = f"{stem}{base_path.suffix}"
     counter = 1
-    while candidate.exists():
-        candidate = base_path.with_name(
-            f"{base_path.stem}_{'_'.join(suffix_parts)}_{counter}{base_path.suffix}"
-        )
+    while name in existing:
+        name = f"{stem}_{counter}{base_path.suffix}"
         counter += 1
-    return candidate
+    return base_path.with_name(name)
 
 
 def build_classifier(args: argparse.Namespace) -> Tuple[Any, Dict[str, Any]]:
     """Create the classifier specified by CLI arguments and accompanying metadata."""
 
     model_type = args.model_type
-    if model_type == "random_forest":
-        classifier = RandomForestClassifier(
+    if model_type == "hist_gbdt":
+        classifier = HistGradientBoostingClassifier(
+            max_iter=args.trees,
+            max_depth=args.max_depth,
+            learning_rate=0.1,
+            early_stopping=True,
+            validation_fraction=0.1,
+            categorical_features=None,
+            class_weight="balanced",
+            random_state=args.seed,
+        )
+    elif model_type == "random_forest":
+        classifier = ensemble.RandomForestClassifier(
             n_estimators=args.trees,
             max_depth=args.max_depth,
             random_state=args.seed,
-            class_weight="balanced_subsample",
             n_jobs=-1,
         )
     elif model_type == "extra_trees":
-        classifier = ExtraTreesClassifier(
+        classifier = ensemble.ExtraTreesClassifier(
             n_estimators=args.trees,
             max_depth=args.max_depth,
             random_state=args.seed,
-            class_weight="balanced_subsample",
             n_jobs=-1,
         )
     elif model_type == "sgd":
@@ -161,7 +241,7 @@ def build_classifier(args: argparse.Namespace) -> Tuple[Any, Dict[str, Any]]:
             class_weight="balanced",
         )
     elif model_type == "logistic":
-        classifier = LogisticRegression(
+        classifier = linear_model.LogisticRegression(
             solver="lbfgs",
             max_iter=1000,
             class_weight="balanced",
@@ -172,6 +252,7 @@ def build_classifier(args: argparse.Namespace) -> Tuple[Any, Dict[str, Any]]:
         classifier = MLPClassifier(
             hidden_layer_sizes=(64, 32),
             activation="relu",
+            solver="adam",
             max_iter=750,
             random_state=args.seed,
         )
@@ -187,50 +268,225 @@ def build_classifier(args: argparse.Namespace) -> Tuple[Any, Dict[str, Any]]:
     return classifier, metadata
 
 
-def load_dataset(dataset_path: Path) -> pd.DataFrame:
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# pyarrow parses the CSV multi-threaded; the C parser is used when it is not installed.
+_CSV_ENGINE = "pyarrow" if _HAS_PYARROW else "c"
+
+
+def _dataset_dtypes(dataset_path: Path) -> Dict[str, Any]:
+    """Column dtypes for ``dataset_path``: float32 values and categorical labels.
+
+    Parsing straight into float32 avoids materializing a float64 frame that is
+    converted (and copied) again before training.
+    """
+    columns = pd.read_csv(dataset_path, nrows=0).columns
+    raw_columns = set(raw_landmark_columns())
+    dtypes: Dict[str, Any] = {
+        col: np.float32 for col in columns if col.startswith("f") or col in raw_columns
+    }
+    dtypes.update({col: "category" for col in ("gesture", "handedness") if col in columns})
+    return dtypes
+
+
+def _feature_columns(columns: pd.Index) -> List[str]:
+    """``f``-prefixed columns in numeric order (``f2`` before ``f10``); other names sort last."""
+    candidates = columns[columns.str.startswith("f")]
+    numbers = pd.to_numeric(candidates.str[1:], errors="coerce")
+    order = np.argsort(np.nan_to_num(numbers.to_numpy(dtype=np.float64), nan=np.inf), kind="stable")
+    return candidates[order].tolist()
+
+
+def _complete_rows(df: pd.DataFrame, value_columns: List[str]) -> pd.DataFrame:
+    """Rows with a gesture label and no NaN among the float32 ``value_columns``.
+
+    One row-wise ``any`` over the value block replaces ``dropna``'s per-column masks.
+    """
+    values = df[value_columns].to_numpy(dtype=np.float32, copy=False)
+    valid = ~np.isnan(values).any(axis=1) & df["gesture"].notna().to_numpy()
+    return df if valid.all() else df[valid]
+
+
+def _read_dataset(dataset_path: Path) -> pd.DataFrame:
+    """Read the dataset CSV through a Parquet side-copy that is reused until the CSV changes.
+
+    Parquet keeps the float32/categorical column types, so repeat runs skip
+    parsing text entirely. Requires pyarrow; without it the CSV is always parsed.
+    """
+    cache_path = dataset_path.with_suffix(".parquet")
+    if _HAS_PYARROW:
+        try:
+            if cache_path.stat().st_mtime >= dataset_path.stat().st_mtime:
+                return pd.read_parquet(cache_path)
+        except Exception:
+            # Missing, stale or unreadable side-copy: fall back to the CSV.
+            pass
+    df = pd.read_csv(dataset_path, dtype=_dataset_dtypes(dataset_path), engine=_CSV_ENGINE)
+    if _HAS_PYARROW:
+        _write_parquet_cache(df, cache_path)
+    return df
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Write the Parquet side-copy atomically.
+
+    ``train_all_models.py --jobs`` runs several trainers on the same CSV, so the
+    copy is written to a temporary file and renamed into place; readers only
+    ever see a complete file.
+    """
+    tmp_name: Optional[str] = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{cache_path.name}.", suffix=".tmp", dir=cache_path.parent
+        )
+        os.close(fd)
+        df.to_parquet(tmp_name, compression="snappy", index=False)
+        os.replace(tmp_name, cache_path)
+    except Exception as exc:
+        print(f"Could not cache the dataset as Parquet at {cache_path}: {exc}")
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def load_dataset(dataset_path: Path) -> Tuple[pd.DataFrame, List[str]]:
+    """Load a dataset and its feature columns in order, dropping incomplete rows."""
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset not found at {dataset_path}")
-    df = pd.read_csv(dataset_path)
+    df = _read_dataset(dataset_path)
     required_columns = {"gesture", "handedness"}
     missing = required_columns - set(df.columns)
     if missing:
         raise ValueError(f"Dataset missing required columns: {sorted(missing)}")
-    feature_columns = sorted(
-        (col for col in df.columns if col.startswith("f")),
-        key=lambda name: int(name[1:]) if name[1:].isdigit() else name,
-    )
+    raw_columns = raw_landmark_columns()
+    if set(raw_columns).issubset(df.columns):
+        df = _features_from_raw_landmarks(_complete_rows(df, raw_columns), raw_columns)
+    feature_columns = _feature_columns(df.columns)
     if not feature_columns:
         raise ValueError("Dataset does not contain any feature columns (expected columns prefixed with 'f').")
-    df = df.dropna(subset=feature_columns + ["gesture"])
-    return df
-
-
-def train_model(df: pd.DataFrame, args: argparse.Namespace) -> Dict[str, object]:
-    feature_columns = sorted(
-        (col for col in df.columns if col.startswith("f")),
-        key=lambda name: int(name[1:]) if name[1:].isdigit() else name,
+    return _complete_rows(df, feature_columns), feature_columns
+
+
+def _features_from_raw_landmarks(df: pd.DataFrame, raw_columns: List[str]) -> pd.DataFrame:
+    """Normalize a raw-landmark dataset (``collect_gesture_dataset.py --raw-landmarks``) in one pass."""
+    points = df[raw_columns].to_numpy(dtype=np.float32).reshape(len(df), -1, 3)
+    handedness = df["handedness"].astype(str).tolist()
+    features = GestureFeatureExtractor().extract_batch(points, handedness)
+    feature_frame = pd.DataFrame(
+        features,
+        columns=[f"f{i}" for i in range(features.shape[1])],
+        index=df.index,
     )
-    X = df[feature_columns].to_numpy(dtype=np.float32)
+    return pd.concat([df[["gesture", "handedness"]], feature_frame], axis=1)
+
+
+@dataclass
+class TrainedModel:
+    """A fitted classifier plus everything saved alongside it."""
+
+    classifier: Any
+    label_encoder: LabelEncoder
+    feature_names: List[str]
+    metadata: Dict[str, Any]
+    packed_forest: Optional[Dict[str, Any]] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """The plain dict written to disk, so loading a model never needs this script."""
+        payload: Dict[str, Any] = {
+            "classifier": self.classifier,
+            "label_encoder": self.label_encoder,
+            "feature_names": self.feature_names,
+            "metadata": self.metadata,
+        }
+        if self.packed_forest is not None:
+            payload["packed_forest"] = self.packed_forest
+        return payload
+
+
+EVAL_CHUNK_ROWS = 4096
+
+
+def predict_in_chunks(
+    classifier: Any,
+    X: np.ndarray,
+    packed_forest: Optional[Dict[str, Any]] = None,
+    chunk: int = EVAL_CHUNK_ROWS,
+) -> np.ndarray:
+    """Predict ``X`` ``chunk`` rows at a time into one preallocated label array.
+
+    Bounded chunks keep the per-chunk probability matrix small on large holdout
+    sets. Forests with ``packed_forest`` arrays are scored through them, which
+    evaluates all trees per row in one compiled pass; otherwise forests predict
+    through scikit-learn, which splits the trees over the active joblib backend.
+    """
+    classes = classifier.classes_
+    y_pred = np.empty(len(X), dtype=classes.dtype)
+    best = np.empty(min(chunk, len(X)), dtype=np.intp)
+    for start in range(0, len(X), chunk):
+        rows = X[start : start + chunk]
+        if packed_forest is not None:
+            np.argmax(packed_forest_proba(packed_forest, rows), axis=1, out=best[: len(rows)])
+            y_pred[start : start + len(rows)] = classes[best[: len(rows)]]
+        else:
+            y_pred[start : start + len(rows)] = classifier.predict(rows)
+    return y_pred
+
+
+def train_model(
+    df: pd.DataFrame, feature_columns: List[str], args: argparse.Namespace
+) -> TrainedModel:
+    # Already float32 from load_dataset, so this does not convert again. Tree models
+    # train on float32 directly; the other solvers work in float64 and would upcast
+    # internally anyway, so convert once up front.
+    X = df[feature_columns].to_numpy(dtype=np.float32, copy=False)
+    if args.model_type not in FLOAT32_MODEL_TYPES:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+    # Sorted factorization yields the same codes and classes_ as LabelEncoder.fit_transform
+    # without a Python list of labels; the encoder is kept for inverse_transform.
+    codes, uniques = pd.factorize(df["gesture"], sort=True)
+    y = codes.astype(np.int16, copy=False)
     encoder = LabelEncoder()
-    y = encoder.fit_transform(df["gesture"].tolist())
+    encoder.classes_ = np.asarray(uniques)
 
     test_ratio = args.test_ratio if 0.0 < args.test_ratio < 0.5 else 0.2
+    # Split by index so X is only gathered into train/test copies when each is used.
     if len(df) < 10:
-        X_train, X_test, y_train, y_test = X, X, y, y
+        train_idx = test_idx = slice(None)
     else:
-        X_train, X_test, y_train, y_test = train_test_split(
-            X,
-            y,
-            test_size=test_ratio,
-            stratify=y if len(np.unique(y)) > 1 else None,
-            random_state=args.seed,
-        )
+        splitter_cls = StratifiedShuffleSplit if len(np.unique(y)) > 1 else ShuffleSplit
+        splitter = splitter_cls(n_splits=1, test_size=test_ratio, random_state=args.seed)
+        ((train_idx, test_idx),) = splitter.split(X, y)
 
     classifier, classifier_meta = build_classifier(args)
-    classifier.fit(X_train, y_train)
-
-    if len(X_test) > 0:
-        y_pred = classifier.predict(X_test)
+    if args.model_type in SCALED_MODEL_TYPES:
+        # Embedding the scaler keeps every inference backend (scikit-learn, ONNX,
+        # hummingbird) applying the same standardization.
+        classifier = Pipeline([("scaler", StandardScaler()), ("clf", classifier)])
+    fit_started = time.monotonic_ns()
+    if args.model_type in FOREST_MODEL_TYPES:
+        # Forest trees release the GIL, so threads avoid the cost of worker processes.
+        # Class balancing comes from one precomputed weight vector rather than
+        # class_weight="balanced_subsample" recounting classes for every tree.
+        y_train = y[train_idx]
+        sample_weight = compute_sample_weight("balanced", y_train)
+        with joblib.parallel_backend("threading", n_jobs=-1):
+            classifier.fit(X[train_idx], y_train, sample_weight=sample_weight)
+    else:
+        classifier.fit(X[train_idx], y[train_idx])
+    fit_seconds = (time.monotonic_ns() - fit_started) / 1e9
+    packed_forest = pack_forest(classifier) if args.model_type in FOREST_MODEL_TYPES else None
+
+    y_test = y[test_idx]
+    if len(y_test) > 0:
+        if args.model_type in FOREST_MODEL_TYPES:
+            # Without numba the packed arrays only have a single-threaded numpy path;
+            # the estimator's own predict spreads the trees over threads instead.
+            eval_forest = packed_forest if importlib.util.find_spec("numba") is not None else None
+            with joblib.parallel_backend("threading", n_jobs=-1):
+                y_pred = predict_in_chunks(classifier, X[test_idx], eval_forest)
+        else:
+            y_pred = predict_in_chunks(classifier, X[test_idx])
         unique_classes = np.unique(y_test)
         target_labels = encoder.inverse_transform(unique_classes)
         report = classification_report(
@@ -244,27 +500,38 @@ def train_model(df: pd.DataFrame, args: argparse.Namespace) -> Dict[str, object]
     else:
         report = {"overall": {"precision": 1.0, "recall": 1.0, "f1-score": 1.0}}
 
-    payload = {
-        "classifier": classifier,
-        "label_encoder": encoder,
-        "feature_names": feature_columns,
-        "metadata": {
-            "trained_at": datetime.utcnow().isoformat() + "Z",
-            "dataset_path": str(args.dataset),
-            "test_ratio": test_ratio,
-            "samples": len(df),
-            "gestures": sorted(df["gesture"].unique()),
-            "report": report,
-        },
+    metadata: Dict[str, Any] = {
+        "trained_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "fit_seconds": round(fit_seconds, 3),
+        "intelex_patched": "sklearnex" in sys.modules,
+        "dataset_path": str(args.dataset),
+        "test_ratio": test_ratio,
+        "samples": len(df),
+        "gestures": sorted(df["gesture"].unique()),
+        "report": report,
     }
-    payload["metadata"].update(classifier_meta)
-    return payload
+    metadata.update(classifier_meta)
+    if isinstance(classifier, Pipeline):
+        scaler = classifier.named_steps["scaler"]
+        metadata["feature_stats"] = {
+            "mean": scaler.mean_.astype(np.float32),
+            "inv_std": (1.0 / scaler.scale_).astype(np.float32),
+        }
+    return TrainedModel(
+        classifier=classifier,
+        label_encoder=encoder,
+        feature_names=feature_columns,
+        metadata=metadata,
+        packed_forest=packed_forest if args.quantize else None,
+    )
 
 
 def main() -> None:
     args = parse_args()
-    df = load_dataset(args.dataset)
-    payload = train_model(df, args)
+    if args.intelex and not patch_intelex():
+        print("scikit-learn-intelex is not installed (pip install scikit-learn-intelex); using scikit-learn.")
+    df, feature_columns = load_dataset(args.dataset)
+    model = train_model(df, feature_columns, args)
 
     output_base = args.output
     if not output_base.is_absolute():
@@ -274,14 +541,40 @@ def main() -> None:
         print(f"Output file {output_base} exists; saving to {output_path} instead.")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    metadata_entry = payload.setdefault("metadata", {})
-    if isinstance(metadata_entry, dict):
-        metadata_entry["output_path"] = str(output_path)
-    else:
-        payload["metadata"] = {"output_path": str(output_path)}
-    joblib.dump(payload, output_path)
+    compress = _model_compression()
+    storage = {
+        "output_path": str(output_path),
+        "compress": f"{compress[0]}:{compress[1]}",
+        "protocol": MODEL_PICKLE_PROTOCOL,
+    }
+    # Convert before saving so the export's path can go into the metadata, but write it
+    # after the joblib file: the recognizer ignores exports older than the model.
+    onnx_path = onnx_sibling_paths(output_path)[0]
+    onnx_model = None
+    if importlib.util.find_spec("skl2onnx") is not None:
+        try:
+            onnx_model = sklearn_to_onnx(model.classifier, len(model.feature_names))
+        except Exception as exc:  # pragma: no cover - converter gaps leave the joblib model usable
+            print(
+                "ONNX export failed; the recognizer will use scikit-learn: "
+                f"{type(exc).__name__}: {exc}"
+            )
+        else:
+            storage["onnx_path"] = str(onnx_path)
+    elif args.quantize:
+        print("Skipping ONNX export: skl2onnx is not installed (pip install skl2onnx)")
+    model.metadata.update(storage)
+    joblib.dump(model.to_payload(), output_path, compress=compress, protocol=MODEL_PICKLE_PROTOCOL)
     print(f"Model saved to {output_path}")
 
+    if onnx_model is not None:
+        try:
+            exported = write_onnx(onnx_model, onnx_path, quantize=args.quantize)
+        except Exception as exc:  # pragma: no cover - the joblib model is already saved
+            print(f"ONNX export incomplete: {type(exc).__name__}: {exc}")
+        else:
+            print(f"ONNX model saved to {exported}")
+
     gesture_config = load_gesture_config(args.config)
     print("Configured gestures:")
     for item in gesture_config.get("gestures", []):
@@ -289,16 +582,13 @@ def main() -> None:
         event = item.get("event")
         print(f"  - {label} -> {event}")
 
-    metadata = payload.get("metadata")
-    if isinstance(metadata, dict):
-        report = metadata.get("report", {})
-        if isinstance(report, dict):
-            overall = report.get("accuracy") or report.get("overall", {})
-            if isinstance(overall, dict):
-                precision = overall.get("precision", "n/a")
-                recall = overall.get("recall", "n/a")
-                f1 = overall.get("f1-score", "n/a")
-                print(f"Evaluation -> precision: {precision}, recall: {recall}, f1: {f1}")
+    report = model.metadata["report"]
+    overall = report.get("accuracy") or report.get("overall", {})
+    if isinstance(overall, dict):
+        precision = overall.get("precision", "n/a")
+        recall = overall.get("recall", "n/a")
+        f1 = overall.get("f1-score", "n/a")
+        print(f"Evaluation -> precision: {precision}, recall: {recall}, f1: {f1}")
 
 
 if __name__ == "__main__":
@@ -1,16 +1,171 @@
+import functools
 import math
+import queue
 import threading
 import time
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union, cast
 
 import cv2
 import mediapipe as mp
+import numpy as np
 
 from ..cameras.local_camera import LocalCamera
+from ..cameras.threaded_camera import LatestSlot, ThreadedCamera, put_latest
 from ..detectors.gesture.gesture_recognizer import GestureRecognizer
 
+# Wrist and the index/middle/ring/pinky MCP joints used to measure hand size.
+_WRIST_INDEX = 0
+_THUMB_TIP_INDEX = 4
+_MCP_INDICES = np.array([5, 9, 13, 17])
+
+
+def _landmark_points(landmarks: Sequence[Any]) -> np.ndarray:
+    """Copy MediaPipe's 21 landmarks into a ``(21, 3)`` float32 array in one pass."""
+    return np.fromiter(
+        (value for lm in landmarks for value in (lm.x, lm.y, lm.z)),
+        dtype=np.float32,
+        count=3 * len(landmarks),
+    ).reshape(-1, 3)
+
+
+class _HandResults(NamedTuple):
+    """The ``multi_hand_landmarks``/``multi_handedness`` pair of ``Hands.process``."""
+
+    multi_hand_landmarks: Optional[List[Any]]
+    multi_handedness: Optional[List[Any]]
+
+
+def _create_hand_landmarker(
+    model_path: Union[str, Path],
+    max_num_hands: int,
+    detection_confidence: float,
+    tracking_confidence: float,
+) -> Any:
+    """Create a MediaPipe Tasks ``HandLandmarker`` running on video frames."""
+    from mediapipe.tasks.python import BaseOptions, vision
+
+    options = vision.HandLandmarkerOptions(
+        base_options=BaseOptions(model_asset_path=str(model_path)),
+        running_mode=vision.RunningMode.VIDEO,
+        num_hands=max_num_hands,
+        min_hand_detection_confidence=detection_confidence,
+        min_hand_presence_confidence=detection_confidence,
+        min_tracking_confidence=tracking_confidence,
+    )
+    return vision.HandLandmarker.create_from_options(options)
+
+
+def _landmarker_to_hand_results(result: Any) -> _HandResults:
+    """Convert a ``HandLandmarkerResult`` to the protos the legacy solution returns.
+
+    Overlap filtering, landmark drawing and the gesture recognizer all consume
+    ``NormalizedLandmarkList``/``ClassificationList`` messages, so both backends
+    feed them the same shapes.
+    """
+    if not result.hand_landmarks:
+        return _HandResults(None, None)
+    from mediapipe.framework.formats import classification_pb2, landmark_pb2
+
+    multi_hand_landmarks = [
+        landmark_pb2.NormalizedLandmarkList(
+            landmark=[
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in hand
+            ]
+        )
+        for hand in result.hand_landmarks
+    ]
+    multi_handedness = [
+        classification_pb2.ClassificationList(
+            classification=[
+                classification_pb2.Classification(
+                    index=category.index, score=category.score, label=category.category_name
+                )
+                for category in categories
+            ]
+        )
+        for categories in result.handedness
+    ]
+    return _HandResults(multi_hand_landmarks, multi_handedness)
+
+
+# Size of the grayscale thumbnails compared to detect motion between frames.
+_MOTION_THUMBNAIL_SIZE = (32, 24)
+
+
+def _motion_thumbnail(frame: np.ndarray) -> np.ndarray:
+    """Downscale a BGR frame to a small grayscale image for cheap motion checks."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, _MOTION_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+
+
+def _has_motion(thumbnail: np.ndarray, reference: Optional[np.ndarray], threshold: float) -> bool:
+    """Whether any thumbnail pixel changed by at least ``threshold`` gray levels.
+
+    The largest per-pixel change is used rather than the mean: a pinch or a small
+    finger slide only touches a few thumbnail pixels and vanishes in a global mean.
+    """
+    if reference is None:
+        return True
+    return cv2.norm(thumbnail, reference, cv2.NORM_INF) >= threshold
+
+
+def _handedness_score(handedness: Any) -> float:
+    """Confidence of a hand's top handedness classification (0 when missing)."""
+    try:
+        if handedness.classification:
+            return float(handedness.classification[0].score)
+    except AttributeError:
+        pass
+    return 0.0
+
+
+def _to_pixel(x: float, y: float, width: int, height: int) -> Tuple[int, int]:
+    """Map normalized image coordinates to pixels, clamping to the frame."""
+    return int(max(0.0, min(1.0, x)) * width), int(max(0.0, min(1.0, y)) * height)
+
+
+def _hand_geometry(pts: np.ndarray, tip_indices: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Return the hand's reference span and each tip's squared distance to the thumb tip.
+
+    The span is the mean wrist-to-MCP distance, which scales the touch threshold
+    with how far the hand is from the camera.
+    """
+    xy = pts[:, :2]
+    mcp = xy[_MCP_INDICES] - xy[_WRIST_INDEX]
+    tips = xy[tip_indices] - xy[_THUMB_TIP_INDEX]
+    return float(np.hypot(mcp[:, 0], mcp[:, 1]).mean()), np.einsum("ij,ij->i", tips, tips)
+
+
+def _hand_geometry_kernel(pts: np.ndarray, tip_indices: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Scalar-loop form of :func:`_hand_geometry` for numba to compile."""
+    wrist_x = pts[_WRIST_INDEX, 0]
+    wrist_y = pts[_WRIST_INDEX, 1]
+    span = 0.0
+    for idx in _MCP_INDICES:
+        dx = pts[idx, 0] - wrist_x
+        dy = pts[idx, 1] - wrist_y
+        span += math.sqrt(dx * dx + dy * dy)
+    thumb_x = pts[_THUMB_TIP_INDEX, 0]
+    thumb_y = pts[_THUMB_TIP_INDEX, 1]
+    distances = np.empty(len(tip_indices), dtype=np.float32)
+    for k in range(len(tip_indices)):
+        dx = pts[tip_indices[k], 0] - thumb_x
+        dy = pts[tip_indices[k], 1] - thumb_y
+        distances[k] = dx * dx + dy * dy
+    return span / len(_MCP_INDICES), distances
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_hand_geometry() -> Any:
+    """``_hand_geometry_kernel`` compiled with numba, or the NumPy version without numba."""
+    try:
+        import numba
+    except ImportError:
+        return _hand_geometry
+    return numba.njit(fastmath=True)(_hand_geometry_kernel)
+
 
 class FingerSliderStrategy:
     """Encapsulates the pinch-based slider control logic used by FingerSliderInput."""
@@ -31,6 +186,11 @@ class FingerSliderStrategy:
     INVERTED_VERTICAL_JOINTS = {}
     INVERTED_HORIZONTAL_JOINTS = {}
     DEFAULT_REFERENCE_SPAN: float = 0.175
+    MODE_COLORS: Dict[str, Tuple[int, int, int]] = {
+        "PAUSED": (0, 165, 255),
+        "ACTIVE": (0, 255, 0),
+        "ZEROING": (0, 200, 255),
+    }
 
     def __init__(
         self,
@@ -57,14 +217,44 @@ class FingerSliderStrategy:
         min_touch_scale: float = 0.3,
         max_touch_scale: float = 2.0,
         min_hand_separation: float = 0.12,
+        model_complexity: int = 0,
+        hand_landmarker_model: Optional[Union[str, Path]] = None,
+        motion_threshold: float = 0.0,
     ) -> None:
-        self._camera = LocalCamera(camera_index)
-        self._camera_index = self._camera.camera_index
-        self._hands = mp.solutions.hands.Hands(
-            max_num_hands=max_num_hands,
-            min_detection_confidence=detection_confidence,
-            min_tracking_confidence=tracking_confidence,
-        )
+        # Everything close() touches exists before anything below can raise, so a
+        # failed construction (e.g. a bad landmarker model) still tears down cleanly.
+        self._stop_event = threading.Event()
+        self._camera: Optional[ThreadedCamera] = None
+        self._hands: Any = None
+        self._landmarker: Any = None
+        self._inference_thread: Optional[threading.Thread] = None
+        self._gesture_thread: Optional[threading.Thread] = None
+        self._show_window = False
+
+        local_camera = LocalCamera(camera_index)
+        self._camera_index = local_camera.camera_index
+        # Capture runs on its own thread and only the newest frame is kept.
+        self._camera = ThreadedCamera(local_camera)
+        # With a ``hand_landmarker.task`` file the Tasks API HandLandmarker is used
+        # instead of the legacy solution; it has less per-frame Python overhead.
+        self._landmarker_timestamp_ms = -1
+        # Largest per-pixel gray-level change (on a small thumbnail) below which a
+        # frame reuses the last hand results instead of running inference again.
+        # Off by default (0); camera noise means useful values are around 10-20.
+        self._motion_threshold = max(0.0, motion_threshold)
+        if hand_landmarker_model is not None:
+            self._landmarker = _create_hand_landmarker(
+                hand_landmarker_model, max_num_hands, detection_confidence, tracking_confidence
+            )
+        else:
+            # Sliders only track coarse fingertip positions, so the lite landmark
+            # model (0) is accurate enough and roughly halves inference time.
+            self._hands = mp.solutions.hands.Hands(
+                model_complexity=model_complexity,
+                max_num_hands=max_num_hands,
+                min_detection_confidence=detection_confidence,
+                min_tracking_confidence=tracking_confidence,
+            )
         self._touch_threshold = touch_threshold
         self._touch_ratio = touch_ratio if touch_ratio is not None else (
             touch_threshold / self.DEFAULT_REFERENCE_SPAN
@@ -88,6 +278,18 @@ class FingerSliderStrategy:
         self._joint_indices = sorted(
             {idx for pair in self._joint_pairs.values() for idx in pair}
         )
+        # The finger set is fixed once the joint pairs are known, so resolve it
+        # here instead of filtering FINGER_TIPS for every hand on every frame.
+        self._tracked_fingers: Tuple[Tuple[str, int], ...] = tuple(
+            (finger_name, tip_idx)
+            for finger_name, tip_idx in self.FINGER_TIPS.items()
+            if finger_name in self._joint_pairs or finger_name == "pinky"
+        )
+        self._tracked_tip_indices = np.array(
+            [tip_idx for _, tip_idx in self._tracked_fingers], dtype=np.int64
+        )
+        # Compile now rather than on the first hand.
+        _jit_hand_geometry()(np.zeros((21, 3), dtype=np.float32), self._tracked_tip_indices)
         self._joint_state: Dict[Union[int, str], float] = {
             idx: 0.0 for idx in self._joint_indices
         }
@@ -113,8 +315,11 @@ class FingerSliderStrategy:
             self._gesture_recognizer = GestureRecognizer(gesture_config_path, model="mlp")
         self._pending_gesture_events: List[Tuple[str, Union[int, str], float]] = []
         self._gesture_update_interval = max(0.0, gesture_update_interval)
-        self._last_gesture_update = 0.0
         self._last_gesture_overlays: List[str] = []
+        # Hands are handed to the gesture worker through a single-slot queue, and
+        # its events/overlays come back under this lock.
+        self._gesture_lock = threading.Lock()
+        self._gesture_inputs: "queue.Queue[Tuple[Any, Any]]" = queue.Queue(maxsize=1)
         self._status_message: str = ""
         self._status_message_until: float = 0.0
         if self._gesture_recognizer is not None and self._gesture_recognizer.enabled:
@@ -136,6 +341,22 @@ class FingerSliderStrategy:
                     cv2.WINDOW_FULLSCREEN,
                 )
 
+        # MediaPipe runs on a worker thread that publishes (frame, results) for the
+        # newest frame; get_events only consumes it, so capture, inference and the
+        # slider/UI work overlap instead of running back to back. ``None`` marks a
+        # lost camera.
+        self._latest_result: LatestSlot[Optional[Tuple[Any, Any]]] = LatestSlot()
+        self._consumed_version = 0
+        self._inference_thread = threading.Thread(
+            target=self._inference_loop, name="finger-slider-inference", daemon=True
+        )
+        self._inference_thread.start()
+        if self._gesture_recognizer is not None:
+            self._gesture_thread = threading.Thread(
+                target=self._gesture_loop, name="finger-slider-gestures", daemon=True
+            )
+            self._gesture_thread.start()
+
     @property
     def camera_index(self) -> int:
         return self._camera_index
@@ -171,7 +392,12 @@ class FingerSliderStrategy:
         return commands
 
     def get_events(self) -> List[Tuple[str, Any, float]]:
-        joint_values = self._process_frame()
+        version, latest = self._latest_result.get()
+        if version == self._consumed_version:
+            # No new inference result since the last call; nothing has changed.
+            return []
+        self._consumed_version = version
+        joint_values = self._process_frame(latest)
         events: List[Tuple[str, Any, float]] = []
 
         if joint_values is None:
@@ -239,11 +465,18 @@ class FingerSliderStrategy:
         return events
 
     def close(self) -> None:
-        with self._lock:
-            if self._hands:
-                self._hands.close()
-            if self._camera and self._camera.is_opened():
-                self._camera.release()
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        for worker in (self._inference_thread, self._gesture_thread):
+            if worker is not None and worker is not threading.current_thread():
+                worker.join(timeout=2.0)
+        if self._hands:
+            self._hands.close()
+        if self._landmarker:
+            self._landmarker.close()
+        if self._camera and self._camera.is_opened():
+            self._camera.release()
         if self._show_window:
             cv2.destroyWindow(self._window_name)
 
@@ -252,19 +485,52 @@ class FingerSliderStrategy:
 
     # Internal helpers -------------------------------------------------
 
-    def _process_frame(self) -> Optional[Dict[int, float]]:
-        with self._lock:
-            if not self._camera or not self._camera.is_opened():
-                return None
-
-            ret, frame = self._camera.read()
+    def _inference_loop(self) -> None:
+        # Thumbnail of the last frame that actually ran inference, and its results.
+        # Comparing against that frame rather than the previous one keeps slow,
+        # gradual movement from drifting away from stale landmarks.
+        reference: Optional[np.ndarray] = None
+        cached_results: Any = None
+        camera = self._camera
+        if camera is None:
+            return
+        while not self._stop_event.is_set():
+            if not camera.is_opened():
+                self._latest_result.set(None)
+                return
+            ret, frame = camera.read()
             if not ret:
-                return None
-
+                self._latest_result.set(None)
+                reference = None
+                continue
             frame = cv2.flip(frame, 1)
+            if self._motion_threshold > 0.0:
+                thumbnail = _motion_thumbnail(frame)
+                if not _has_motion(thumbnail, reference, self._motion_threshold):
+                    # The scene has not changed: republish the last hands so hold
+                    # timers and the preview keep running without a MediaPipe call.
+                    self._latest_result.set((frame, cached_results))
+                    continue
+                reference = thumbnail
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self._hands.process(rgb)
-            frame_to_show = frame if self._show_window else None
+            cached_results = self._detect_hands(rgb)
+            self._latest_result.set((frame, cached_results))
+
+    def _detect_hands(self, rgb) -> Any:
+        if self._landmarker is None:
+            return self._hands.process(rgb)
+        # VIDEO mode needs strictly increasing timestamps.
+        timestamp_ms = max(int(time.monotonic() * 1000), self._landmarker_timestamp_ms + 1)
+        self._landmarker_timestamp_ms = timestamp_ms
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        return _landmarker_to_hand_results(self._landmarker.detect_for_video(image, timestamp_ms))
+
+    def _process_frame(self, latest: Optional[Tuple[Any, Any]]) -> Optional[Dict[int, float]]:
+        if latest is None:
+            return None
+        frame, results = latest
+        frame_to_show = frame if self._show_window else None
+        frame_size = (frame.shape[1], frame.shape[0])
         joint_values: Dict[int, float] = {idx: 0.0 for idx in self._joint_indices}
         prev_joint_values = dict(self._joint_state)
         gripper_value = 0.0
@@ -273,21 +539,34 @@ class FingerSliderStrategy:
 
         filtered_landmarks: Optional[List[Any]] = None
         filtered_handedness: Optional[List[Any]] = None
+        filtered_points: List[np.ndarray] = []
 
         if results.multi_hand_landmarks and results.multi_handedness:
-            filtered_landmarks, filtered_handedness = self._filter_overlapping_hands(
-                list(results.multi_hand_landmarks),
-                list(results.multi_handedness),
-            )
+            hand_landmarks_list = list(results.multi_hand_landmarks)
+            handedness_list = list(results.multi_handedness)
+            # Read every landmark out of the protobuf once; all geometry below
+            # works on these arrays.
+            hand_points = [_landmark_points(hand.landmark) for hand in hand_landmarks_list]
+            kept = self._filter_overlapping_hands(hand_points, handedness_list)
+            filtered_landmarks = [hand_landmarks_list[idx] for idx in kept]
+            filtered_handedness = [handedness_list[idx] for idx in kept]
+            filtered_points = [hand_points[idx] for idx in kept]
 
         if filtered_landmarks and filtered_handedness:
-            for hand_landmarks, handedness in zip(filtered_landmarks, filtered_handedness):
+            for hand_landmarks, handedness, pts in zip(
+                filtered_landmarks, filtered_handedness, filtered_points
+            ):
                 label = handedness.classification[0].label  # 'Left' or 'Right'
-                landmarks = hand_landmarks.landmark
-                thumb_tip = landmarks[4]
-                dynamic_threshold = self._get_dynamic_touch_threshold(landmarks)
+                thumb_tip = pts[_THUMB_TIP_INDEX]
+                reference_span, tip_distances_sq = _jit_hand_geometry()(
+                    pts, self._tracked_tip_indices
+                )
+                dynamic_threshold = self._get_dynamic_touch_threshold(reference_span)
+                dynamic_threshold_sq = dynamic_threshold * dynamic_threshold
                 if frame_to_show is not None:
-                    self._draw_touch_threshold_circle(frame_to_show, thumb_tip, dynamic_threshold)
+                    self._draw_touch_threshold_circle(
+                        frame_to_show, frame_size, thumb_tip, dynamic_threshold
+                    )
                 if frame_to_show is not None and self._hand_overlay_enabled:
                     self._drawing_utils.draw_landmarks(
                         frame_to_show,
@@ -295,26 +574,23 @@ class FingerSliderStrategy:
                         mp.solutions.hands.HAND_CONNECTIONS,
                     )
 
-                for finger_name, tip_idx in self.FINGER_TIPS.items():
-                    if finger_name not in self._joint_pairs and finger_name != "pinky":
-                        continue
-
+                for (finger_name, tip_idx), tip_distance_sq in zip(
+                    self._tracked_fingers, tip_distances_sq.tolist()
+                ):
                     key = (label, finger_name)
-                    finger_tip = landmarks[tip_idx]
+                    finger_tip = pts[tip_idx]
 
-                    touching = self._fingers_touching(
-                        landmarks, 4, tip_idx, dynamic_threshold
-                    )
-                    if touching:
+                    if tip_distance_sq < dynamic_threshold_sq:
                         active_keys.add(key)
+                        tip_x, tip_y = finger_tip[:2].tolist()
                         state = self._pinch_states.setdefault(
                             key,
-                            {"base_x": finger_tip.x, "base_y": finger_tip.y},
+                            {"base_x": tip_x, "base_y": tip_y},
                         )
 
                         if finger_name == "pinky":
                             raw_vertical = self._clamp(
-                                (state["base_y"] - finger_tip.y) * self._vertical_gain
+                                (state["base_y"] - tip_y) * self._vertical_gain
                             )
                             raw_vertical = self._apply_deadzone(raw_vertical)
 
@@ -333,6 +609,7 @@ class FingerSliderStrategy:
                                 overlay_rows.append(
                                     self._draw_gripper_overlay(
                                         frame_to_show,
+                                        frame_size,
                                         thumb_tip,
                                         finger_tip,
                                         state,
@@ -342,10 +619,10 @@ class FingerSliderStrategy:
                             continue
 
                         raw_horizontal = self._clamp(
-                            (finger_tip.x - state["base_x"]) * self._horizontal_gain
+                            (tip_x - state["base_x"]) * self._horizontal_gain
                         )
                         raw_vertical = self._clamp(
-                            (state["base_y"] - finger_tip.y) * self._vertical_gain
+                            (state["base_y"] - tip_y) * self._vertical_gain
                         )
 
                         joint_horizontal, joint_vertical = self._joint_pairs[finger_name]
@@ -377,6 +654,7 @@ class FingerSliderStrategy:
                             overlay_rows.append(
                                 self._draw_slider_overlay(
                                     frame_to_show,
+                                    frame_size,
                                     thumb_tip,
                                     finger_tip,
                                     state,
@@ -412,18 +690,13 @@ class FingerSliderStrategy:
             )
 
             mode_text = self._get_display_mode().upper()
-            mode_color_map = {
-                "PAUSED": (0, 165, 255),
-                "ACTIVE": (0, 255, 0),
-                "ZEROING": (0, 200, 255),
-            }
             cv2.putText(
                 frame_to_show,
                 f"Mode: {mode_text}",
                 (10, 40),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.6,
-                mode_color_map.get(mode_text, (255, 255, 255)),
+                self.MODE_COLORS.get(mode_text, (255, 255, 255)),
                 2 if mode_text == "ZEROING" else 1,
                 cv2.LINE_AA,
             )
@@ -476,10 +749,11 @@ class FingerSliderStrategy:
         return joint_values
 
     def _consume_gesture_events(self) -> List[Tuple[str, Union[int, str], float]]:
-        if not self._pending_gesture_events:
-            return []
-        events = list(self._pending_gesture_events)
-        self._pending_gesture_events = []
+        with self._gesture_lock:
+            if not self._pending_gesture_events:
+                return []
+            events = self._pending_gesture_events
+            self._pending_gesture_events = []
         return events
 
     def _update_gesture_recognizer(
@@ -488,31 +762,37 @@ class FingerSliderStrategy:
         multi_handedness: Optional[Sequence[object]],
         overlay_rows: List[str],
     ) -> None:
+        """Hand the newest hands to the gesture worker and show its latest overlays."""
         if self._gesture_recognizer is None:
-            self._pending_gesture_events = []
-            self._last_gesture_overlays = []
             return
-
-        now = time.time()
-        if (
-            self._gesture_update_interval > 0.0
-            and now - self._last_gesture_update < self._gesture_update_interval
-        ):
+        put_latest(self._gesture_inputs, (multi_hand_landmarks, multi_handedness))
+        with self._gesture_lock:
             overlay_rows.extend(self._last_gesture_overlays)
-            return
 
-        events, overlays = self._gesture_recognizer.process(multi_hand_landmarks, multi_handedness)
-        self._pending_gesture_events = []
-        for event in events:
-            if event.change == "start":
-                self._pending_gesture_events.append(
-                    ("press", event.event, max(event.confidence, 0.0))
-                )
-            elif event.change == "end":
-                self._pending_gesture_events.append(("release", event.event, 0.0))
-        overlay_rows.extend(overlays)
-        self._last_gesture_overlays = list(overlays)
-        self._last_gesture_update = now
+    def _gesture_loop(self) -> None:
+        """Classify the newest hands at most once per ``gesture_update_interval``."""
+        recognizer = self._gesture_recognizer
+        if recognizer is None:
+            return
+        while not self._stop_event.is_set():
+            try:
+                multi_hand_landmarks, multi_handedness = self._gesture_inputs.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            started = time.monotonic()
+            events, overlays = recognizer.process(multi_hand_landmarks, multi_handedness)
+            converted: List[Tuple[str, Union[int, str], float]] = []
+            for event in events:
+                if event.change == "start":
+                    converted.append(("press", event.event, max(event.confidence, 0.0)))
+                elif event.change == "end":
+                    converted.append(("release", event.event, 0.0))
+            with self._gesture_lock:
+                self._pending_gesture_events.extend(converted)
+                self._last_gesture_overlays = list(overlays)
+            remaining = self._gesture_update_interval - (time.monotonic() - started)
+            if remaining > 0.0:
+                self._stop_event.wait(remaining)
 
     def _apply_smoothing(
         self, joint_index: Union[int, str], target: float, prev_values: Dict[Union[int, str], float]
@@ -531,21 +811,7 @@ class FingerSliderStrategy:
     def _clamp(value: float) -> float:
         return max(-1.0, min(1.0, value))
 
-    def _fingers_touching(
-        self,
-        landmarks,
-        idx1: int,
-        idx2: int,
-        dynamic_threshold: Optional[float] = None,
-    ) -> bool:
-        dx = landmarks[idx2].x - landmarks[idx1].x
-        dy = landmarks[idx2].y - landmarks[idx1].y
-        if dynamic_threshold is None:
-            dynamic_threshold = self._get_dynamic_touch_threshold(landmarks)
-        return (dx * dx + dy * dy) ** 0.5 < dynamic_threshold
-
-    def _get_dynamic_touch_threshold(self, landmarks) -> float:
-        base_span = self._compute_reference_span(landmarks)
+    def _get_dynamic_touch_threshold(self, base_span: float) -> float:
         if base_span <= 0.0:
             return self._current_touch_threshold
 
@@ -600,71 +866,41 @@ class FingerSliderStrategy:
 
     def _filter_overlapping_hands(
         self,
-        hand_landmarks_list: Sequence[Any],
+        hand_points: Sequence[np.ndarray],
         handedness_list: Sequence[Any],
-    ) -> Tuple[List[Any], List[Any]]:
-        if not hand_landmarks_list or not handedness_list or self._min_hand_separation <= 0.0:
-            return list(hand_landmarks_list), list(handedness_list)
-
-        filtered: List[Dict[str, Any]] = []
-
-        for landmarks_obj, handedness_obj in zip(hand_landmarks_list, handedness_list):
-            if not hasattr(landmarks_obj, "landmark") or not landmarks_obj.landmark:
-                continue
-            wrist = landmarks_obj.landmark[0]
-            score = 0.0
-            try:
-                if handedness_obj.classification:
-                    score = handedness_obj.classification[0].score
-            except AttributeError:
-                score = 0.0
-
-            keep = True
-            for idx, entry in enumerate(filtered):
-                other_wrist = entry["landmarks"].landmark[0]
-                separation = math.hypot(wrist.x - other_wrist.x, wrist.y - other_wrist.y)
-                if separation < self._min_hand_separation:
-                    if score > entry["score"]:
-                        filtered[idx] = {
-                            "landmarks": landmarks_obj,
-                            "handedness": handedness_obj,
-                            "score": score,
-                        }
-                    keep = False
-                    break
-
-            if keep:
-                filtered.append(
-                    {
-                        "landmarks": landmarks_obj,
-                        "handedness": handedness_obj,
-                        "score": score,
-                    }
-                )
-
-        return (
-            [entry["landmarks"] for entry in filtered],
-            [entry["handedness"] for entry in filtered],
+    ) -> List[int]:
+        """Return the indices of the hands to keep, dropping near-duplicate detections.
+
+        Hands are accepted from the highest handedness score down; any later hand
+        whose wrist lies within ``min_hand_separation`` of an accepted one is
+        dropped. Kept indices are returned in MediaPipe's original order.
+        """
+        count = min(len(hand_points), len(handedness_list))
+        candidates = [index for index in range(count) if len(hand_points[index])]
+        if self._min_hand_separation <= 0.0 or len(candidates) < 2:
+            return candidates
+
+        wrists = np.array([hand_points[index][_WRIST_INDEX, :2] for index in candidates])
+        scores = np.array([_handedness_score(handedness_list[index]) for index in candidates])
+        offsets = wrists[:, None, :] - wrists[None, :, :]
+        too_close = np.einsum("ijk,ijk->ij", offsets, offsets) < (
+            self._min_hand_separation * self._min_hand_separation
         )
 
-    @staticmethod
-    def _compute_reference_span(landmarks) -> float:
-        wrist = landmarks[0]
-        mcp_indices = (5, 9, 13, 17)
-        distances: List[float] = []
-        wx, wy = wrist.x, wrist.y
-        for idx in mcp_indices:
-            pt = landmarks[idx]
-            dx = pt.x - wx
-            dy = pt.y - wy
-            distances.append((dx * dx + dy * dy) ** 0.5)
-        if not distances:
-            return 0.0
-        return sum(distances) / len(distances)
+        suppressed = np.zeros(len(candidates), dtype=bool)
+        kept: List[int] = []
+        # Stable sort so the earlier detection wins a tie, as before.
+        for position in np.argsort(-scores, kind="stable").tolist():
+            if suppressed[position]:
+                continue
+            kept.append(candidates[position])
+            suppressed |= too_close[position]
+        return sorted(kept)
 
     def _draw_slider_overlay(
         self,
         frame,
+        frame_size: Tuple[int, int],
         thumb_tip,
         finger_tip,
         state: Dict[str, float],
@@ -674,24 +910,16 @@ class FingerSliderStrategy:
         horizontal: float,
         vertical: float,
     ) -> str:
-        h, w, _ = frame.shape
-
-        def to_pixel(x: float, y: float) -> Tuple[int, int]:
-            px = int(max(0.0, min(1.0, x)) * w)
-            py = int(max(0.0, min(1.0, y)) * h)
-            return px, py
-
-        base_pt = to_pixel(state["base_x"], state["base_y"])
-        finger_pt = to_pixel(finger_tip.x, finger_tip.y)
-        thumb_pt = to_pixel(thumb_tip.x, thumb_tip.y)
+        w, h = frame_size
+        base_pt = _to_pixel(state["base_x"], state["base_y"], w, h)
+        finger_pt = _to_pixel(finger_tip[0], finger_tip[1], w, h)
+        thumb_pt = _to_pixel(thumb_tip[0], thumb_tip[1], w, h)
 
         cv2.circle(frame, finger_pt, 8, (0, 255, 0), 2)
         cv2.circle(frame, thumb_pt, 6, (0, 128, 255), 2)
         cv2.circle(frame, base_pt, 5, (255, 0, 0), 2)
         cv2.line(frame, base_pt, (finger_pt[0], base_pt[1]), (200, 200, 0), 1)
         cv2.line(frame, base_pt, (base_pt[0], finger_pt[1]), (200, 0, 200), 1)
-        return f"Pinky Gripper: {vertical:+.2f}"
-
         return (
             f"{finger_name.capitalize()} H[{joint_horizontal}]: {horizontal:+.2f} "
             f"V[{joint_vertical}]: {vertical:+.2f}"
@@ -700,21 +928,16 @@ class FingerSliderStrategy:
     def _draw_gripper_overlay(
         self,
         frame,
+        frame_size: Tuple[int, int],
         thumb_tip,
         finger_tip,
         state: Dict[str, float],
         vertical: float,
     ) -> str:
-        h, w, _ = frame.shape
-
-        def to_pixel(x: float, y: float) -> Tuple[int, int]:
-            px = int(max(0.0, min(1.0, x)) * w)
-            py = int(max(0.0, min(1.0, y)) * h)
-            return px, py
-
-        base_pt = to_pixel(state["base_x"], state["base_y"])
-        finger_pt = to_pixel(finger_tip.x, finger_tip.y)
-        thumb_pt = to_pixel(thumb_tip.x, thumb_tip.y)
+        w, h = frame_size
+        base_pt = _to_pixel(state["base_x"], state["base_y"], w, h)
+        finger_pt = _to_pixel(finger_tip[0], finger_tip[1], w, h)
+        thumb_pt = _to_pixel(thumb_tip[0], thumb_tip[1], w, h)
 
         cv2.circle(frame, finger_pt, 8, (0, 200, 0), 2)
         cv2.circle(frame, thumb_pt, 6, (0, 128, 255), 2)
@@ -723,13 +946,14 @@ class FingerSliderStrategy:
 
         return f"Pinky Gripper: {vertical:+.2f}"
 
-    def _draw_touch_threshold_circle(self, frame, thumb_tip, threshold: float) -> None:
+    def _draw_touch_threshold_circle(
+        self, frame, frame_size: Tuple[int, int], thumb_tip, threshold: float
+    ) -> None:
         if threshold <= 0.0:
             return
 
-        h, w, _ = frame.shape
-        cx = int(max(0.0, min(1.0, thumb_tip.x)) * w)
-        cy = int(max(0.0, min(1.0, thumb_tip.y)) * h)
+        w, h = frame_size
+        cx, cy = _to_pixel(thumb_tip[0], thumb_tip[1], w, h)
         avg_extent = 0.5 * (w + h)
         radius = int(max(2.0, min(threshold * avg_extent, float(max(w, h)))))
         cv2.circle(frame, (cx, cy), radius, (255, 200, 0), 1, lineType=cv2.LINE_AA)
\ No newline at end of file
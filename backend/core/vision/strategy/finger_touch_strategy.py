@@ -25,6 +25,11 @@ class FingerTouchStrategy:
         "pinky": 3,
     }
     DEFAULT_REFERENCE_SPAN: float = 0.175
+    MODE_COLORS: Dict[str, Tuple[int, int, int]] = {
+        "PAUSED": (0, 165, 255),
+        "ACTIVE": (0, 255, 0),
+        "ZEROING": (0, 200, 255),
+    }
 
     def __init__(
         self,
@@ -57,6 +62,8 @@ class FingerTouchStrategy:
         self._base_touch_threshold = self._touch_ratio * self.DEFAULT_REFERENCE_SPAN
         self._scale = scale
         self._last_gestures = cast(Dict[str, Optional[str]], {"Left": None, "Right": None})
+        # Reused for every frame; callers must consume it before the next frame.
+        self._gestures: Dict[str, Optional[str]] = {"Left": None, "Right": None}
         self._lock = threading.Lock()
         self._show_window = show_window
         self._window_name = window_name
@@ -158,16 +165,19 @@ class FingerTouchStrategy:
             if not self._camera or not self._camera.is_opened():
                 return None
 
+            gestures = self._gestures
+            gestures["Left"] = None
+            gestures["Right"] = None
+
             ret, frame = self._camera.read()
             if not ret:
-                return {"Left": None, "Right": None}
+                return gestures
 
             frame = cv2.flip(frame, 1)
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             results = self._hands.process(rgb)
             frame_to_show = frame if self._show_window else None
 
-        gestures: Dict[str, Optional[str]] = {"Left": None, "Right": None}
         if results.multi_hand_landmarks and results.multi_handedness:
             for hand_landmarks, handedness in zip(
                 results.multi_hand_landmarks, results.multi_handedness
@@ -210,18 +220,13 @@ class FingerTouchStrategy:
             )
 
             mode_text = self._get_display_mode().upper()
-            mode_color_map = {
-                "PAUSED": (0, 165, 255),
-                "ACTIVE": (0, 255, 0),
-                "ZEROING": (0, 200, 255),
-            }
             cv2.putText(
                 frame_to_show,
                 f"Mode: {mode_text}",
                 (10, 40),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.6,
-                mode_color_map.get(mode_text, (255, 255, 255)),
+                self.MODE_COLORS.get(mode_text, (255, 255, 255)),
                 2 if mode_text == "ZEROING" else 1,
                 cv2.LINE_AA,
             )
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import inspect
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest  # type: ignore[import]
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.core.input.finger_slider_input import FingerSliderInput  # noqa: E402
+from backend.core.vision.cameras.threaded_camera import LatestSlot  # noqa: E402
+from backend.core.vision.strategy.finger_slider_strategy import FingerSliderStrategy  # noqa: E402
+
+
+class FakeCamera:
+    """Plays back a fixed list of frames, then stops the loop."""
+
+    def __init__(self, frames: List["np.ndarray"], stop_event: threading.Event):
+        self._frames = list(frames)
+        self._stop_event = stop_event
+
+    def is_opened(self) -> bool:
+        return True
+
+    def read(self):
+        frame = self._frames.pop(0)
+        if not self._frames:
+            self._stop_event.set()
+        return True, frame
+
+
+def run_inference_loop(frames, motion_threshold: float) -> int:
+    """Run the inference loop over ``frames`` and return how many ran detection."""
+    # Skip __init__ so no real camera or MediaPipe model is opened.
+    strategy = FingerSliderStrategy.__new__(FingerSliderStrategy)
+    strategy._stop_event = threading.Event()
+    strategy._camera = FakeCamera(frames, strategy._stop_event)
+    strategy._latest_result = LatestSlot()
+    strategy._motion_threshold = motion_threshold
+    calls: List[int] = []
+    strategy._detect_hands = lambda rgb: calls.append(1)
+    strategy._inference_loop()
+    return len(calls)
+
+
+def make_scene(seed: int = 0) -> "np.ndarray":
+    rng = np.random.default_rng(seed)
+    return rng.integers(40, 200, size=(480, 640, 3), dtype=np.uint8)
+
+
+def test_static_frames_reuse_results():
+    scene = make_scene()
+    assert run_inference_loop([scene.copy() for _ in range(5)], motion_threshold=12.0) == 1
+
+
+def test_small_localized_change_runs_inference():
+    scene = make_scene()
+    moved = scene.copy()
+    # A fingertip-sized patch (about 0.1% of the frame) changes, as in a pinch.
+    moved[200:220, 300:316] = 255
+    assert run_inference_loop([scene, scene.copy(), moved], motion_threshold=12.0) == 2
+
+
+@pytest.mark.parametrize("cls", [FingerSliderStrategy, FingerSliderInput])
+def test_gating_is_off_by_default(cls):
+    assert inspect.signature(cls).parameters["motion_threshold"].default == 0.0
+
+
+def test_disabled_gate_runs_every_frame():
+    scene = make_scene()
+    frames = [scene.copy() for _ in range(4)]
+    assert run_inference_loop(frames, motion_threshold=0.0) == len(frames)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
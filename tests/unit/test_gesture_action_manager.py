@@ -9,10 +9,12 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.core.vision.gesture_recognizer import (  # noqa: E402
+from backend.core.vision.detectors.gesture.gesture_recognizer import (  # noqa: E402
+    HAND_SLOTS,
     GestureActionConfig,
     GestureActionManager,
     HandPrediction,
+    HandPredictions,
 )
 
 
@@ -77,5 +79,94 @@ def test_two_hand_activation_requires_both_hands():
     assert events[0].event == "teleop_resume"
 
 
+def test_hand_predictions_slots_follow_hand_order():
+    left = HandPrediction("thumbs_up", 0.9)
+    right = HandPrediction("thumbs_down", 0.8)
+
+    slots = HandPredictions.from_mapping({"right": right, "LEFT": left, "Other": left})
+    assert HAND_SLOTS == ("Left", "Right")
+    assert slots == HandPredictions(left=left, right=right)
+    assert slots[0] is left and slots[1] is right
+    assert HandPredictions.from_mapping({}) == HandPredictions(None, None)
+
+
+def test_slot_tuple_and_mapping_inputs_are_equivalent():
+    configs = [GestureActionConfig(label="rock_and_roll", event="zero_all_joints", hold_frames=2)]
+    from_tuple = GestureActionManager(configs)
+    from_mapping = GestureActionManager(configs)
+    frames = [
+        {"Right": HandPrediction("rock_and_roll", 0.9)},
+        {"Right": HandPrediction("rock_and_roll", 0.8)},
+        {"Right": HandPrediction("rock_and_roll", 0.85)},
+        {},
+    ]
+
+    for frame in frames:
+        assert from_tuple.update(HandPredictions.from_mapping(frame)) == from_mapping.update(frame)
+
+
+def test_allowed_hand_restricts_which_slot_triggers():
+    manager = GestureActionManager(
+        [
+            GestureActionConfig(
+                label="thumbs_down",
+                event="teleop_pause",
+                hold_frames=2,
+                allowed_hands=["right"],
+            )
+        ]
+    )
+
+    # The gesture on the left hand is ignored however long it is held.
+    for _ in range(4):
+        assert manager.update(HandPredictions(left=HandPrediction("thumbs_down", 0.9))) == []
+
+    right = HandPredictions(right=HandPrediction("thumbs_down", 0.7))
+    assert manager.update(right) == []
+    events = manager.update(right)
+    assert [(event.change, event.event) for event in events] == [("start", "teleop_pause")]
+    assert events[0].confidence == pytest.approx(0.7)
+
+    # Holding keeps the gesture active without repeating the start event.
+    assert manager.update(right) == []
+    assert manager.update(right) == []
+
+    events = manager.update(HandPredictions(left=HandPrediction("thumbs_down", 0.9)))
+    assert [(event.change, event.event) for event in events] == [("end", "teleop_pause")]
+
+
+def test_hold_count_resets_when_label_changes():
+    manager = GestureActionManager(
+        [GestureActionConfig(label="rock_and_roll", event="zero_all_joints", hold_frames=3)]
+    )
+    gesture = HandPredictions(left=HandPrediction("rock_and_roll", 0.9))
+    neutral = HandPredictions(left=HandPrediction("neutral", 0.9))
+
+    manager.update(gesture)
+    manager.update(gesture)
+    assert manager.update(neutral) == []
+    manager.update(gesture)
+    assert manager.update(gesture) == []
+    events = manager.update(gesture)
+    assert events and events[0].change == "start"
+
+
+def test_end_event_is_reused_across_activations():
+    manager = GestureActionManager(
+        [GestureActionConfig(label="thumbs_up", event="teleop_resume", hold_frames=1, overlay="Resume")]
+    )
+    gesture = HandPredictions(right=HandPrediction("thumbs_up", 0.95))
+
+    ends = []
+    for _ in range(2):
+        start = manager.update(gesture)
+        assert start[0].change == "start" and start[0].overlay == "Resume"
+        ends.extend(manager.update(HandPredictions()))
+
+    assert len(ends) == 2
+    assert ends[0] is ends[1]
+    assert ends[0].change == "end" and ends[0].confidence == 0.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
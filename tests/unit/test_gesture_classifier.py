@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest  # type: ignore[import]
+
+np = pytest.importorskip("numpy")
+joblib = pytest.importorskip("joblib")
+ensemble = pytest.importorskip("sklearn.ensemble")
+preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.core.vision.detectors.gesture import gesture_recognizer  # noqa: E402
+from backend.core.vision.detectors.gesture.gesture_recognizer import (  # noqa: E402
+    MLGestureClassifier,
+    pack_forest,
+    packed_forest_proba,
+)
+
+LABELS = np.array(["neutral", "rock_and_roll", "thumbs_down", "thumbs_up"])
+
+
+def make_dataset(rows: int = 600, features: int = 12, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(scale=1.5, size=(len(LABELS), features))
+    y = rng.integers(0, len(LABELS), size=rows)
+    X = (centers[y] + rng.normal(scale=1.2, size=(rows, features))).astype(np.float32)
+    return X, LABELS[y]
+
+
+def save_model(tmp_path: Path, estimator, X, labels) -> Path:
+    encoder = preprocessing.LabelEncoder().fit(labels)
+    estimator.fit(X, encoder.transform(labels))
+    path = tmp_path / "model.joblib"
+    joblib.dump(
+        {
+            "classifier": estimator,
+            "label_encoder": encoder,
+            "feature_names": [f"f{idx}" for idx in range(X.shape[1])],
+        },
+        path,
+    )
+    return path
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.4, 0.6, 0.8])
+def test_early_exit_keeps_full_forest_decisions(tmp_path, threshold):
+    X, labels = make_dataset()
+    estimator = ensemble.RandomForestClassifier(n_estimators=96, max_depth=6, random_state=0)
+    classifier = MLGestureClassifier(save_model(tmp_path, estimator, X, labels), backend="sklearn")
+    assert classifier._early_exit
+
+    # Noisier rows than the training data so some frames are undecided. The
+    # recognizer classifies a frame's hands together, so rows go in one at a time.
+    probe = X[:150] + np.random.default_rng(1).normal(scale=1.0, size=(150, X.shape[1])).astype(
+        np.float32
+    )
+    full_labels, full_confidences = classifier.decode_batch(classifier.predict_proba(probe))
+    early_proba = np.vstack(
+        [classifier.predict_proba_decisive(probe[row : row + 1], threshold) for row in range(len(probe))]
+    )
+    early_labels, early_confidences = classifier.decode_batch(early_proba)
+    # Some rows must actually have stopped early for the comparison to mean anything.
+    assert not np.allclose(early_confidences, full_confidences)
+
+    for full_label, full_conf, early_label, early_conf in zip(
+        full_labels, full_confidences, early_labels, early_confidences
+    ):
+        accepted = full_conf >= threshold
+        assert (early_conf >= threshold) == accepted
+        if accepted:
+            assert early_label == full_label
+
+
+def test_early_exit_labels_match_full_forest(tmp_path):
+    X, labels = make_dataset(seed=3)
+    estimator = ensemble.ExtraTreesClassifier(n_estimators=64, random_state=0)
+    classifier = MLGestureClassifier(save_model(tmp_path, estimator, X, labels), backend="sklearn")
+
+    probe = X[:150] + np.random.default_rng(2).normal(scale=1.0, size=(150, X.shape[1])).astype(
+        np.float32
+    )
+    expected = classifier.decode_batch(classifier.predict_proba(probe))[0]
+    assert [classifier.predict_labels(probe[row : row + 1])[0] for row in range(len(probe))] == expected
+
+
+def test_unreadable_onnx_export_falls_back_to_sklearn(tmp_path):
+    pytest.importorskip("onnxruntime")
+    X, labels = make_dataset(rows=200)
+    estimator = ensemble.RandomForestClassifier(n_estimators=8, random_state=0)
+    model_path = save_model(tmp_path, estimator, X, labels)
+    # A truncated export that is newer than the model is picked as the ONNX source.
+    model_path.with_suffix(".onnx").write_bytes(b"\x08\x07\x12\x04trunc")
+
+    classifier = MLGestureClassifier(model_path, backend="auto")
+
+    assert classifier.backend == "sklearn"
+    assert classifier.predict_labels(X[:5]) == classifier.decode_batch(classifier.predict_proba(X[:5]))[0]
+
+
+def test_onnx_conversion_is_written_atomically(tmp_path, monkeypatch):
+    pytest.importorskip("onnxruntime")
+
+    class FakeExport:
+        def SerializeToString(self) -> bytes:
+            return b"converted"
+
+    monkeypatch.setattr(gesture_recognizer, "sklearn_to_onnx", lambda estimator, features: FakeExport())
+    X, labels = make_dataset(rows=200)
+    estimator = ensemble.RandomForestClassifier(n_estimators=8, random_state=0)
+    model_path = save_model(tmp_path, estimator, X, labels)
+
+    classifier = MLGestureClassifier(model_path, backend="auto")
+
+    assert model_path.with_suffix(".onnx").read_bytes() == b"converted"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["model.joblib", "model.onnx"]
+    # The fake export is not a valid model, so loading falls back instead of raising.
+    assert classifier.backend == "sklearn"
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        ensemble.RandomForestClassifier(n_estimators=24, random_state=0),
+        ensemble.ExtraTreesClassifier(n_estimators=24, max_depth=8, random_state=0),
+    ],
+    ids=["random_forest", "extra_trees"],
+)
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+def test_packed_forest_matches_predict_proba(monkeypatch, estimator, use_numba):
+    if use_numba and gesture_recognizer._jit_packed_forest_kernel() is None:
+        pytest.skip("numba is not installed")
+    if not use_numba:
+        monkeypatch.setattr(gesture_recognizer, "_jit_packed_forest_kernel", lambda: None)
+
+    X, labels = make_dataset(rows=400)
+    estimator.fit(X, labels)
+    packed = pack_forest(estimator)
+
+    # Rows sitting exactly on (float32-rounded) split thresholds of the first tree
+    # exercise the rounding applied by pack_forest.
+    tree = estimator.estimators_[0].tree_
+    splits = np.flatnonzero(tree.children_left >= 0)
+    boundary = np.repeat(X[:1], len(splits), axis=0)
+    boundary[np.arange(len(splits)), tree.feature[splits]] = tree.threshold[splits].astype(np.float32)
+
+    noisy = X + np.random.default_rng(4).normal(scale=1.0, size=X.shape).astype(np.float32)
+    probe = np.vstack([X, noisy, boundary]).astype(np.float32)
+    expected = estimator.predict_proba(probe)
+    actual = packed_forest_proba(packed, probe)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import random
+import sys
+from collections import Counter, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pytest  # type: ignore[import]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.core.vision.detectors.gesture.gesture_recognizer import (  # noqa: E402
+    HAND_SLOTS,
+    GestureRecognizer,
+)
+
+CLASSES = ["neutral", "rock_and_roll", "thumbs_down", "thumbs_up"]
+
+
+class DequeSmoother:
+    """The original deque/Counter smoother, kept as the reference behaviour."""
+
+    def __init__(self, window: int, min_consensus: int, max_history: int):
+        self._window = window
+        self._min_consensus = min_consensus
+        self._max_history = max_history
+        self._history: Dict[str, Deque[Optional[str]]] = {}
+        self._scores: Dict[str, Deque[float]] = {}
+
+    def update(self, hand: str, label: Optional[str], confidence: float) -> Tuple[Optional[str], float]:
+        history = self._history.setdefault(hand, deque(maxlen=self._max_history))
+        scores = self._scores.setdefault(hand, deque(maxlen=self._max_history))
+        history.append(label)
+        scores.append(confidence)
+
+        recent_labels = list(history)[-self._window :]
+        recent_scores = list(scores)[-self._window :]
+        counts = Counter(lbl for lbl in recent_labels if lbl)
+        if not counts:
+            return None, 0.0
+        best_label, best_count = counts.most_common(1)[0]
+        if best_count < self._min_consensus:
+            return None, 0.0
+        relevant = [score for lbl, score in zip(recent_labels, recent_scores) if lbl == best_label]
+        return best_label, sum(relevant) / len(relevant)
+
+
+def make_recognizer(tmp_path: Path, window: int = 5) -> GestureRecognizer:
+    config = tmp_path / "gestures.yml"
+    config.write_text(
+        f"model:\n  path: {tmp_path / 'missing.joblib'}\n  smoothing_window: {window}\ngestures: []\n",
+        encoding="utf-8",
+    )
+    recognizer = GestureRecognizer(config)
+    # No model is loaded, so give the smoother a class list directly.
+    recognizer._class_labels = list(CLASSES)
+    recognizer._class_ids = {label: idx for idx, label in enumerate(CLASSES)}
+    recognizer._allocate_history()
+    return recognizer
+
+
+def test_smoothing_requires_consensus(tmp_path):
+    recognizer = make_recognizer(tmp_path)
+    left = HAND_SLOTS.index("Left")
+
+    assert recognizer._update_hand_history(left, "thumbs_up", 0.9) == (None, 0.0)
+    assert recognizer._update_hand_history(left, "thumbs_up", 0.8) == (None, 0.0)
+    label, confidence = recognizer._update_hand_history(left, "thumbs_up", 0.7)
+    assert label == "thumbs_up"
+    assert confidence == pytest.approx(0.8)
+
+    # A below-threshold frame counts against the window but not towards the label.
+    label, confidence = recognizer._update_hand_history(left, None, 0.2)
+    assert label == "thumbs_up"
+    assert confidence == pytest.approx(0.8)
+
+
+def test_smoothing_matches_deque_reference_with_dropouts(tmp_path):
+    recognizer = make_recognizer(tmp_path)
+    reference = DequeSmoother(
+        window=recognizer._smoothing_window,
+        min_consensus=recognizer._min_consensus,
+        max_history=recognizer._max_history,
+    )
+    rng = random.Random(7)
+    choices: List[Optional[str]] = [*CLASSES, None]
+
+    for _ in range(400):
+        for hand in HAND_SLOTS:
+            # Hands regularly leave the frame; their history must survive until they return.
+            if rng.random() < 0.3:
+                continue
+            # Sticky labels so the window often reaches consensus.
+            label = rng.choice(choices) if rng.random() < 0.4 else CLASSES[HAND_SLOTS.index(hand) + 1]
+            confidence = round(rng.uniform(0.3, 1.0), 3)
+            expected_label, expected_confidence = reference.update(hand, label, confidence)
+            label_out, confidence_out = recognizer._update_hand_history(
+                HAND_SLOTS.index(hand), label, confidence
+            )
+            assert label_out == expected_label
+            assert confidence_out == pytest.approx(expected_confidence)
+
+
+def test_reset_clears_every_slot(tmp_path):
+    recognizer = make_recognizer(tmp_path, window=3)
+    for slot in range(len(HAND_SLOTS)):
+        for _ in range(3):
+            recognizer._update_hand_history(slot, "rock_and_roll", 0.9)
+
+    recognizer.reset()
+
+    for slot in range(len(HAND_SLOTS)):
+        assert recognizer._update_hand_history(slot, "rock_and_roll", 0.9) == (None, 0.0)
+
+
+def test_hands_outside_slots_pass_through(tmp_path):
+    recognizer = make_recognizer(tmp_path)
+    assert recognizer._update_hand_history(-1, "thumbs_down", 0.42) == ("thumbs_down", 0.42)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])